@@ -15,7 +15,12 @@ Endpoints:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -23,6 +28,7 @@ from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 # Ensure src/ is importable
@@ -34,7 +40,11 @@ load_dotenv()
 
 from src.ingestion.cast_parser import parse_file
 from src.ingestion.chunker import SemanticChunkerPipeline
-from src.ingestion.connectors import ConfluenceConnector, GitHubConnector
+from src.ingestion.connectors import (
+    ConfluenceConnector,
+    GitHubConnector,
+    aclose_shared_clients,
+)
 from src.knowledge.vector_store import VectorStore
 from src.orchestration.adk_core import (
     AgentResponse,
@@ -45,6 +55,7 @@ from src.orchestration.adk_core import (
 )
 from src.orchestration.chat_agent import answer
 from src.orchestration.council_agents import run_council
+from src.orchestration.tools import warmup as warmup_vector_store
 from src.skills.registry import SkillRegistry
 
 
@@ -120,6 +131,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     openapi_tags=tags_metadata,
     contact={
         "name": "SquadSense",
@@ -168,6 +180,15 @@ class DiscoverRequest(BaseModel):
         description="File extensions to include when scanning for code files.",
         json_schema_extra={"examples": [[".java", ".ts", ".tsx"]]},
     )
+    upsert_batch_size: int = Field(
+        default=200,
+        description=(
+            "Number of chunks per ChromaDB upsert batch. Smaller batches keep "
+            "memory steady on large ingests; larger batches reduce round trips."
+        ),
+        ge=1,
+        le=500,
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -282,9 +303,21 @@ class ErrorResponse(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Helper
+# Helpers
 # ---------------------------------------------------------------------------
 
+# Tree-sitter parsing is CPU-bound; a process pool keeps the event loop
+# responsive and lets per-file parses run on all cores.
+_parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+@lru_cache(maxsize=1)
+def _registry() -> SkillRegistry:
+    """Shared SkillRegistry instance (constructing one scans/creates the
+    manifests directory, so don't redo it per request)."""
+    return SkillRegistry()
+
+
 def _count_data_files(data_path: str = "data") -> dict[str, int]:
     """Count files in data/code/ and data/docs/."""
     code_dir = Path(data_path) / "code"
@@ -327,7 +360,7 @@ def _count_data_files(data_path: str = "data") -> dict[str, int]:
     ),
 )
 async def health_check() -> HealthResponse:
-    registry = SkillRegistry()
+    registry = _registry()
     return HealthResponse(
         api_keys=validate_api_keys(),
         skills_count=len(registry.list_skills()),
@@ -350,7 +383,7 @@ async def health_check() -> HealthResponse:
     ),
 )
 async def list_skills() -> SkillListResponse:
-    registry = SkillRegistry()
+    registry = _registry()
     skills = registry.list_skills()
     return SkillListResponse(skills=skills, count=len(skills))
 
@@ -376,7 +409,7 @@ async def list_skills() -> SkillListResponse:
     },
 )
 async def get_skill(skill_name: str) -> SkillDetailResponse:
-    registry = SkillRegistry()
+    registry = _registry()
     content = registry.load_skill(skill_name)
     if not content:
         raise HTTPException(
@@ -401,7 +434,7 @@ async def get_skill(skill_name: str) -> SkillDetailResponse:
     },
 )
 async def delete_skill(skill_name: str) -> SkillDeleteResponse:
-    registry = SkillRegistry()
+    registry = _registry()
     deleted = registry.delete_skill(skill_name)
     if not deleted:
         raise HTTPException(
@@ -455,8 +488,11 @@ async def discover(request: DiscoverRequest) -> DiscoveryResult:
 
         extensions = {ext if ext.startswith(".") else f".{ext}" for ext in request.code_extensions}
 
-        code_docs = await code_connector.fetch_files(extensions=extensions)
-        doc_docs = await doc_connector.fetch_pages()
+        # Code and doc sources are independent — fetch them concurrently.
+        code_docs, doc_docs = await asyncio.gather(
+            code_connector.fetch_files(extensions=extensions),
+            doc_connector.fetch_pages(),
+        )
 
         if not code_docs and not doc_docs:
             raise HTTPException(
@@ -467,37 +503,104 @@ async def discover(request: DiscoverRequest) -> DiscoveryResult:
                 ),
             )
 
-        # --- Step 2: Parse ---
-        all_code_chunks = []
-        for doc in code_docs:
-            file_path = doc.metadata.get("local_path", doc.source)
-            chunks = parse_file(doc.content, file_path)
-            all_code_chunks.extend(chunks)
-
-        # --- Step 3: Chunk ---
+        # --- Steps 2-4: Parse / chunk / embed, pipelined ---
+        # Upsert workers drain batches from a queue while parsing and
+        # chunking are still producing, overlapping CPU work with embedding.
         chunker = SemanticChunkerPipeline()
-        semantic_code = chunker.chunk_code(all_code_chunks)
-        semantic_docs = []
-        for doc in doc_docs:
-            semantic_docs.extend(
-                chunker.chunk_document(doc.content, doc.source, doc.file_type)
-            )
+        store = VectorStore()
 
-        all_semantic = semantic_code + semantic_docs
+        batch_queue: asyncio.Queue[list[dict[str, Any]]] = asyncio.Queue()
+        stored = 0
+        seen_hashes: set[bytes] = set()
+        upsert_errors: list[Exception] = []
+
+        async def _upsert_worker() -> None:
+            # Failures are collected rather than raised: a raise here would
+            # kill the worker (leaving queued batches without task_done, so
+            # join() never returns) and silently undercount chunks_ingested.
+            nonlocal stored
+            while True:
+                batch = await batch_queue.get()
+                try:
+                    # Await into a local before the +=: `stored +` loads
+                    # its operand before the suspension point, so with two
+                    # workers in flight the in-place form loses updates.
+                    n = await asyncio.to_thread(
+                        store.upsert_chunks, request.skill_name, batch
+                    )
+                    stored += n
+                except Exception as e:
+                    upsert_errors.append(e)
+                finally:
+                    batch_queue.task_done()
+
+        def _enqueue_batches(chunks: list) -> None:
+            # Drop chunks with identical content (generated code, vendored
+            # boilerplate) so we never pay to embed the same text twice.
+            unique = []
+            for c in chunks:
+                digest = hashlib.blake2b(c.content.encode("utf-8"), digest_size=16).digest()
+                if digest not in seen_hashes:
+                    seen_hashes.add(digest)
+                    unique.append(c)
+            for i in range(0, len(unique), request.upsert_batch_size):
+                batch_queue.put_nowait([
+                    {"id": c.id, "content": c.content, "metadata": c.metadata}
+                    for c in unique[i:i + request.upsert_batch_size]
+                ])
+
+        workers = [asyncio.create_task(_upsert_worker()) for _ in range(2)]
+
+        async def _parse_and_chunk_code() -> list:
+            loop = asyncio.get_running_loop()
+            parse_tasks = [
+                loop.run_in_executor(
+                    _parse_pool,
+                    parse_file,
+                    doc.text(),
+                    doc.metadata.get("local_path", doc.source),
+                )
+                for doc in code_docs
+            ]
+            parse_results = await asyncio.gather(*parse_tasks)
+            # Stream per-file results straight into the chunker — no
+            # intermediate flat list of every CodeChunk.
+            semantic = chunker.chunk_code(
+                itertools.chain.from_iterable(parse_results)
+            )
+            _enqueue_batches(semantic)
+            return semantic
+
+        async def _chunk_docs() -> list:
+            semantic: list = []
+            for doc in doc_docs:
+                doc_chunks = await asyncio.to_thread(
+                    chunker.chunk_document, doc.text(), doc.source, doc.file_type
+                )
+                _enqueue_batches(doc_chunks)
+                semantic.extend(doc_chunks)
+            return semantic
+
+        try:
+            semantic_code, semantic_docs = await asyncio.gather(
+                _parse_and_chunk_code(), _chunk_docs()
+            )
+            all_semantic = semantic_code + semantic_docs
+
+            # --- Step 5: Run Council (overlapped with remaining upserts) ---
+            # The council routes and budgets chunks per agent itself, and
+            # only needs the chunk list, not the stored vectors — so its
+            # LLM latency hides the tail of the embedding/upsert work.
+            result, _ = await asyncio.gather(
+                run_council(all_semantic, request.skill_name),
+                batch_queue.join(),
+            )
+            if upsert_errors:
+                raise upsert_errors[0]
+        finally:
+            for worker in workers:
+                worker.cancel()
 
-        # --- Step 4: Embed in ChromaDB ---
-        store = VectorStore()
-        chunks_to_upsert = [
-            {"id": c.id, "content": c.content, "metadata": c.metadata}
-            for c in all_semantic
-        ]
-        stored = store.upsert_chunks(request.skill_name, chunks_to_upsert)
-
-        # --- Step 5: Run Council ---
-        combined_text = "\n\n---\n\n".join(
-            c.content for c in all_semantic[:50]  # Cap for LLM context window
-        )
-        result = await run_council(combined_text, request.skill_name)
         result.chunks_ingested = stored
 
         return result
@@ -540,7 +643,7 @@ async def discover(request: DiscoverRequest) -> DiscoveryResult:
     },
 )
 async def chat(request: ChatRequest) -> ChatResponse:
-    registry = SkillRegistry()
+    registry = _registry()
     if not registry.skill_exists(request.skill_hat):
         available = registry.list_skills()
         hint = f" Available skills: {available}" if available else " No skills generated yet."
@@ -561,32 +664,48 @@ async def chat(request: ChatRequest) -> ChatResponse:
 @app.on_event("startup")
 async def startup_event() -> None:
     """Log configuration on startup."""
+    # Load the Chroma client and embedding model off the request path;
+    # otherwise the first retrieval pays it cold.
+    warm = asyncio.create_task(asyncio.to_thread(warmup_vector_store))
+
     api_keys = validate_api_keys()
-    registry = SkillRegistry()
+    registry = _registry()
     skills = registry.list_skills()
     data = _count_data_files()
 
-    print()
-    print("=" * 60)
-    print("  🧠 SquadSense API — v0.1.0")
-    print("=" * 60)
-    print()
-    print("  API Keys:")
-    print(f"    Google Gemini:  {'✅ Ready' if api_keys['google'] else '❌ MISSING (required!)'}")
-    print(f"    GitHub Token:   {'✅ Ready' if api_keys['github'] else '⬜ Not set (using local files)'}")
-    print(f"    Confluence:     {'✅ Ready' if api_keys['confluence'] else '⬜ Not set (using local files)'}")
-    print()
-    print("  Data Folder:")
-    print(f"    Code files:     {data['code_files']}")
-    print(f"    Doc files:      {data['doc_files']}")
-    print()
-    print("  Skills:")
-    print(f"    Generated:      {skills if skills else 'None (run POST /api/discover)'}")
-    print()
-    print("  Endpoints:")
-    print("    Swagger UI:     http://localhost:8000/docs")
-    print("    ReDoc:          http://localhost:8000/redoc")
-    print("    Health:         http://localhost:8000/api/health")
-    print()
-    print("=" * 60)
-    print()
+    # One pre-built banner, one write() syscall — repeated print calls can
+    # stall startup behind slow stdout sinks (journald, Docker log drivers).
+    banner = "\n".join([
+        "",
+        "=" * 60,
+        "  🧠 SquadSense API — v0.1.0",
+        "=" * 60,
+        "",
+        "  API Keys:",
+        f"    Google Gemini:  {'✅ Ready' if api_keys['google'] else '❌ MISSING (required!)'}",
+        f"    GitHub Token:   {'✅ Ready' if api_keys['github'] else '⬜ Not set (using local files)'}",
+        f"    Confluence:     {'✅ Ready' if api_keys['confluence'] else '⬜ Not set (using local files)'}",
+        "",
+        "  Data Folder:",
+        f"    Code files:     {data['code_files']}",
+        f"    Doc files:      {data['doc_files']}",
+        "",
+        "  Skills:",
+        f"    Generated:      {skills if skills else 'None (run POST /api/discover)'}",
+        "",
+        "  Endpoints:",
+        "    Swagger UI:     http://localhost:8000/docs",
+        "    ReDoc:          http://localhost:8000/redoc",
+        "    Health:         http://localhost:8000/api/health",
+        "",
+        "=" * 60,
+        "",
+    ])
+    await asyncio.to_thread(sys.stdout.write, banner + "\n")
+    await warm
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Release pooled HTTP connections."""
+    await aclose_shared_clients()
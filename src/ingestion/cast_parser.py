@@ -7,16 +7,44 @@ source files, preserving associated Javadoc/JSDoc comments for RAG ingestion.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+
 from tree_sitter_language_pack import get_language, get_parser
 
 
+# ---------------------------------------------------------------------------
+# Parser / Query Singletons
+# ---------------------------------------------------------------------------
+# Parser, language, and compiled query objects are immutable and expensive to
+# build, so they are created once at import time instead of per file.
+
+_JAVA_PARSER = get_parser("java")
+_JAVA_LANGUAGE = get_language("java")
+_JAVA_METHOD_QUERY = _JAVA_LANGUAGE.query("(method_declaration) @method")
+
+_TS_PARSER = get_parser("typescript")
+_TS_LANGUAGE = get_language("typescript")
+_TS_QUERY_TEXT = """
+(function_declaration) @func
+(method_definition) @method
+(lexical_declaration
+  (variable_declarator
+    value: (arrow_function) @arrow))
+"""
+_TS_FUNCTION_QUERY = _TS_LANGUAGE.query(_TS_QUERY_TEXT)
+
+
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
-class CodeChunk(BaseModel):
-    """A single extracted code unit with metadata."""
+@dataclass(slots=True)
+class CodeChunk:
+    """A single extracted code unit with metadata.
+
+    A plain dataclass (not Pydantic): chunks are constructed internally in
+    bulk during ingestion, so per-instance validation is wasted work.
+    """
     name: str
     language: str
     body: str
@@ -31,27 +59,42 @@ class CodeChunk(BaseModel):
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _node_text(source_bytes: bytes, node) -> str:
-    """Extract text content from a tree-sitter node."""
-    return source_bytes[node.start_byte:node.end_byte].decode("utf-8", errors="replace")
+def _node_text(source_mv: memoryview, node) -> str:
+    """Extract text content from a tree-sitter node.
 
+    Takes a memoryview so slicing stays copy-free until the final decode.
+    """
+    return bytes(source_mv[node.start_byte:node.end_byte]).decode("utf-8", errors="replace")
 
-def _is_trivial_getter_setter(name: str, body_text: str) -> bool:
+
+def _is_trivial_getter_setter(name: str, source_bytes: bytes, node) -> bool:
     """
     Heuristic: skip simple getters/setters.
     A method is considered trivial if:
       - Its name starts with get/set/is AND
       - Its body has <= 2 statements (roughly: <= 2 semicolons inside braces)
+
+    Counts semicolons directly on the raw bytes so rejected methods never
+    pay for a UTF-8 decode of their body.
     """
     lower_name = name.lower()
     if not any(lower_name.startswith(prefix) for prefix in ("get", "set", "is")):
         return False
-    # Count semicolons as a proxy for statement count
-    semicolons = body_text.count(";")
-    return semicolons <= 2
-
-
-def _find_preceding_comment(source_bytes: bytes, node) -> str:
+    # Count semicolons as a proxy for statement count, bailing out as soon
+    # as a third one is found instead of scanning the whole body.
+    pos = node.start_byte
+    end = node.end_byte
+    hits = 0
+    while hits <= 2:
+        pos = source_bytes.find(b";", pos, end)
+        if pos == -1:
+            break
+        hits += 1
+        pos += 1
+    return hits <= 2
+
+
+def _find_preceding_comment(source_mv: memoryview, node) -> str:
     """
     Walk backwards through siblings to find a Javadoc / block comment
     immediately preceding the given node.
@@ -62,10 +105,11 @@ def _find_preceding_comment(source_bytes: bytes, node) -> str:
 
     comment_types = {"block_comment", "line_comment", "comment"}
     if prev.type in comment_types:
-        text = _node_text(source_bytes, prev)
-        # Only return if it looks like Javadoc / JSDoc
-        if text.strip().startswith("/**") or text.strip().startswith("//"):
-            return text.strip()
+        # Cheap prefix check on raw bytes before paying for a full decode;
+        # the tuple form tests both prefixes in one call.
+        head = bytes(source_mv[prev.start_byte:prev.start_byte + 3])
+        if head.startswith((b"/**", b"//")):
+            return _node_text(source_mv, prev).strip()
     return ""
 
 
@@ -88,31 +132,27 @@ def extract_java_methods(
     Returns:
         List of CodeChunk objects, one per extracted method.
     """
-    parser = get_parser("java")
-    language = get_language("java")
-
     source_bytes = file_content.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    source_mv = memoryview(source_bytes)
+    tree = _JAVA_PARSER.parse(source_bytes)
 
     chunks: list[CodeChunk] = []
 
     # Query for method declarations
-    query = language.query("(method_declaration) @method")
-    matches = query.matches(tree.root_node)
+    matches = _JAVA_METHOD_QUERY.matches(tree.root_node)
 
     for _pattern_idx, match_dict in matches:
         for node in match_dict.get("method", []):
-            body_text = _node_text(source_bytes, node)
-
             # Extract method name
             name_node = node.child_by_field_name("name")
-            method_name = _node_text(source_bytes, name_node) if name_node else "unknown"
+            method_name = _node_text(source_mv, name_node) if name_node else "unknown"
 
-            # Skip trivial getters/setters
-            if _is_trivial_getter_setter(method_name, body_text):
+            # Skip trivial getters/setters before decoding the body
+            if _is_trivial_getter_setter(method_name, source_bytes, node):
                 continue
 
-            docstring = _find_preceding_comment(source_bytes, node)
+            body_text = _node_text(source_mv, node)
+            docstring = _find_preceding_comment(source_mv, node)
 
             chunks.append(CodeChunk(
                 name=method_name,
@@ -147,29 +187,19 @@ def extract_typescript_functions(
     Returns:
         List of CodeChunk objects.
     """
-    parser = get_parser("typescript")
-    language = get_language("typescript")
-
     source_bytes = file_content.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    source_mv = memoryview(source_bytes)
+    tree = _TS_PARSER.parse(source_bytes)
 
     chunks: list[CodeChunk] = []
 
     # Capture function declarations and method definitions
-    query_text = """
-    (function_declaration) @func
-    (method_definition) @method
-    (lexical_declaration
-      (variable_declarator
-        value: (arrow_function) @arrow))
-    """
-    query = language.query(query_text)
-    matches = query.matches(tree.root_node)
+    matches = _TS_FUNCTION_QUERY.matches(tree.root_node)
 
     for _pattern_idx, match_dict in matches:
         for capture_name, nodes in match_dict.items():
             for node in nodes:
-                body_text = _node_text(source_bytes, node)
+                body_text = _node_text(source_mv, node)
 
                 # Determine name based on node type
                 if capture_name == "arrow":
@@ -179,8 +209,8 @@ def extract_typescript_functions(
                 else:
                     name_node = node.child_by_field_name("name")
 
-                func_name = _node_text(source_bytes, name_node) if name_node else "anonymous"
-                docstring = _find_preceding_comment(source_bytes, node)
+                func_name = _node_text(source_mv, name_node) if name_node else "anonymous"
+                docstring = _find_preceding_comment(source_mv, node)
 
                 chunk_type = "method" if capture_name == "method" else "function"
 
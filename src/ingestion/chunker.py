@@ -7,21 +7,34 @@ on structural boundaries (headers, paragraphs) for optimal RAG retrieval.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import io
+import operator
+import re
+from dataclasses import dataclass, field
+from typing import Iterable
 
 from src.ingestion.cast_parser import CodeChunk
 
+# Split points for Markdown content: header lines and horizontal rules.
+# The lookahead keeps the header line attached to the section it opens.
+_HEADER_SPLIT_RE = re.compile(r"(?m)^(?=#|(?:---|\*\*\*|___)\s*$)")
+
 
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
-class SemanticChunk(BaseModel):
-    """A chunk ready for embedding and storage in the vector database."""
+@dataclass(slots=True)
+class SemanticChunk:
+    """A chunk ready for embedding and storage in the vector database.
+
+    A plain dataclass (not Pydantic): chunks are produced internally by the
+    chunkers in bulk, so per-instance validation is wasted work.
+    """
     id: str                          # Unique identifier
     content: str                     # The text content to embed
     chunk_type: str = "code"         # "code" | "doc"
-    metadata: dict = Field(default_factory=dict)
+    metadata: dict = field(default_factory=dict)
 
 
 # ---------------------------------------------------------------------------
@@ -38,47 +51,56 @@ class CodeChunker:
         self.max_chars = max_chars
         self.overlap_chars = overlap_chars
 
-    def chunk(self, code_chunks: list[CodeChunk]) -> list[SemanticChunk]:
+    def chunk(self, code_chunks: Iterable[CodeChunk]) -> list[SemanticChunk]:
         """
         Merge small code chunks from the same file into larger units.
 
         Args:
-            code_chunks: Parsed CodeChunk objects from cast_parser.
+            code_chunks: Parsed CodeChunk objects from cast_parser. Any
+                         iterable works — a generator streams straight into
+                         the per-file grouping without an intermediate list.
 
         Returns:
             List of SemanticChunks ready for embedding.
         """
-        if not code_chunks:
-            return []
-
-        # Group by file
+        # Group by file (single pass over the iterable)
         by_file: dict[str, list[CodeChunk]] = {}
         for chunk in code_chunks:
             by_file.setdefault(chunk.file_path, []).append(chunk)
 
+        if not by_file:
+            return []
+
         semantic_chunks: list[SemanticChunk] = []
 
         for file_path, file_chunks in by_file.items():
-            # Sort by start line
-            file_chunks.sort(key=lambda c: c.start_line)
-
-            current_buffer: list[str] = []
-            current_length = 0
+            # Tree-sitter emits matches in document order, so per-file chunks
+            # are already sorted; only fall back to sorting if that invariant
+            # is ever violated.
+            prev_line = -1
+            for fc in file_chunks:
+                if fc.start_line < prev_line:
+                    file_chunks.sort(key=operator.attrgetter("start_line"))
+                    break
+                prev_line = fc.start_line
+
+            # StringIO gives amortized O(1) appends; a list + join re-copies
+            # the whole buffer on every flush.
+            buf = io.StringIO()
             chunk_idx = 0
 
             for fc in file_chunks:
-                # Build a text representation including docstring
-                text_parts = []
+                # Size of the entry (docstring + newline + body) without
+                # materializing an intermediate joined string
+                entry_len = len(fc.body)
                 if fc.docstring:
-                    text_parts.append(fc.docstring)
-                text_parts.append(fc.body)
-                entry_text = "\n".join(text_parts)
+                    entry_len += len(fc.docstring) + 1
 
-                if current_length + len(entry_text) > self.max_chars and current_buffer:
+                if buf.tell() and buf.tell() + entry_len > self.max_chars:
                     # Flush current buffer
                     semantic_chunks.append(SemanticChunk(
                         id=f"{file_path}::chunk_{chunk_idx}",
-                        content="\n\n".join(current_buffer),
+                        content=buf.getvalue(),
                         chunk_type="code",
                         metadata={
                             "file_path": file_path,
@@ -88,17 +110,20 @@ class CodeChunker:
                         },
                     ))
                     chunk_idx += 1
-                    current_buffer = []
-                    current_length = 0
+                    buf = io.StringIO()
 
-                current_buffer.append(entry_text)
-                current_length += len(entry_text)
+                if buf.tell():
+                    buf.write("\n\n")
+                if fc.docstring:
+                    buf.write(fc.docstring)
+                    buf.write("\n")
+                buf.write(fc.body)
 
             # Flush remaining
-            if current_buffer:
+            if buf.tell():
                 semantic_chunks.append(SemanticChunk(
                     id=f"{file_path}::chunk_{chunk_idx}",
-                    content="\n\n".join(current_buffer),
+                    content=buf.getvalue(),
                     chunk_type="code",
                     metadata={
                         "file_path": file_path,
@@ -171,22 +196,8 @@ class DocumentChunker:
 
     def _split_on_headers(self, content: str) -> list[str]:
         """Split Markdown content on header boundaries (# lines)."""
-        lines = content.split("\n")
-        sections: list[str] = []
-        current: list[str] = []
-
-        for line in lines:
-            stripped = line.strip()
-            # Split on Markdown headers or horizontal rules
-            if (stripped.startswith("#") or stripped in ("---", "***", "___")) and current:
-                sections.append("\n".join(current))
-                current = []
-            current.append(line)
-
-        if current:
-            sections.append("\n".join(current))
-
-        return sections
+        # One C-level regex scan instead of a Python loop over every line.
+        return [section for section in _HEADER_SPLIT_RE.split(content) if section]
 
     def _split_by_length(
         self,
@@ -195,20 +206,45 @@ class DocumentChunker:
         section_idx: int,
     ) -> list[SemanticChunk]:
         """Split a long section into overlapping chunks by character count."""
-        chunks: list[SemanticChunk] = []
+        # Scan for paragraph boundaries on raw UTF-8 bytes — "\n\n" is
+        # ASCII, and byte-level rfind runs a tighter C loop than its str
+        # counterpart. Compute (start, end) spans first, then build chunks.
+        data = text.encode("utf-8")
+        data_len = len(data)
+        max_chars = self.max_chars
+        overlap_chars = self.overlap_chars
+        rfind = data.rfind
+
+        spans: list[tuple[int, int]] = []
         start = 0
-        sub_idx = 0
-
-        while start < len(text):
-            end = min(start + self.max_chars, len(text))
+        while start < data_len:
+            end = min(start + max_chars, data_len)
 
             # Try to break at a paragraph boundary
-            if end < len(text):
-                last_break = text.rfind("\n\n", start, end)
+            if end < data_len:
+                last_break = rfind(b"\n\n", start, end)
                 if last_break > start:
                     end = last_break
+                else:
+                    # Hard cut: snap back to a UTF-8 character boundary
+                    # (continuation bytes are 0b10xxxxxx) so the slice
+                    # never splits a multi-byte sequence.
+                    while end > start and data[end] & 0xC0 == 0x80:
+                        end -= 1
+                    if end == start:  # degenerate: one char > max_chars
+                        end = min(start + max_chars, data_len)
+
+            spans.append((start, end))
+            if end >= data_len:
+                break
+            start = end - overlap_chars
+            while start > 0 and data[start] & 0xC0 == 0x80:
+                start -= 1
 
-            chunk_text = text[start:end].strip()
+        chunks: list[SemanticChunk] = []
+        sub_idx = 0
+        for span_start, span_end in spans:
+            chunk_text = data[span_start:span_end].decode("utf-8", errors="replace").strip()
             if chunk_text:
                 chunks.append(SemanticChunk(
                     id=f"{source}::doc_{section_idx}_{sub_idx}",
@@ -223,8 +259,6 @@ class DocumentChunker:
                 ))
                 sub_idx += 1
 
-            start = end - self.overlap_chars if end < len(text) else len(text)
-
         return chunks
 
 
@@ -246,7 +280,7 @@ class SemanticChunkerPipeline:
         self.code_chunker = CodeChunker(max_chars=code_max_chars)
         self.doc_chunker = DocumentChunker(max_chars=doc_max_chars)
 
-    def chunk_code(self, code_chunks: list[CodeChunk]) -> list[SemanticChunk]:
+    def chunk_code(self, code_chunks: Iterable[CodeChunk]) -> list[SemanticChunk]:
         """Chunk parsed code units."""
         return self.code_chunker.chunk(code_chunks)
 
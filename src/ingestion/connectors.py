@@ -8,21 +8,325 @@ from the local ``data/`` directory for MVP development.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import logging
 import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Bound on concurrent HTTP requests per host — enough to saturate the
+# connection pool without tripping API abuse detection.
+_FETCH_CONCURRENCY = 64
+_fetch_semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+# Bodies larger than this are streamed to disk instead of being held in
+# memory — with 64 concurrent downloads, buffering multi-MB files as str
+# (2x the byte size) adds up fast.
+_STREAM_THRESHOLD = 1_000_000
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP clients
+# ---------------------------------------------------------------------------
+# One pooled client per (base_url, token) — per-instance clients defeat the
+# connection pool and pay a fresh TLS handshake per request. HTTP/2 lets the
+# gather-based fan-outs multiplex many requests over one socket.
+
+_shared_clients: dict[tuple[str, str], httpx.AsyncClient] = {}
+
+
+def _get_shared_client(base_url: str, token: str, headers: dict[str, str]) -> httpx.AsyncClient:
+    """Get (or lazily create) the pooled client for a host/token pair."""
+    key = (base_url, token)
+    client = _shared_clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        _shared_clients[key] = client
+    return client
+
+
+async def aclose_shared_clients() -> None:
+    """Close every pooled client (call from app shutdown)."""
+    for client in _shared_clients.values():
+        if not client.is_closed:
+            await client.aclose()
+    _shared_clients.clear()
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    max_retries: int = 5,
+) -> httpx.Response:
+    """GET with exponential backoff on 429 and 5xx responses.
+
+    Without this, one transient rate-limit response aborts an entire
+    gather fan-out. Honors Retry-After when the API provides it, falling
+    back to capped exponential delay with jitter. Also acquires the shared
+    fetch semaphore, so callers must not wrap it again.
+    """
+    response: httpx.Response
+    for attempt in range(max_retries):
+        async with _fetch_semaphore:
+            response = await client.get(url, params=params, headers=headers)
+
+        if response.status_code != 429 and response.status_code < 500:
+            return response
+        if attempt == max_retries - 1:
+            break
+
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = min(60.0, 2.0 ** attempt) + random.uniform(0, 1)
+        await asyncio.sleep(delay)
+
+    return response
+
+
+# ---------------------------------------------------------------------------
+# In-process document memoization
+# ---------------------------------------------------------------------------
+# Promise-style cache: concurrent callers for the same source share one
+# in-flight fetch, and repeat pipeline runs within the TTL reuse the result
+# without touching the network.
+
+_DOC_CACHE_TTL = 3600.0
+# Sweep expired entries once the cache grows past this many tasks, so the
+# scan cost is amortized over many inserts instead of paid per call.
+_DOC_CACHE_SWEEP_SIZE = 1024
+_doc_cache: dict[str, tuple[float, "asyncio.Task"]] = {}
+# Current cache key per source, so a new revision evicts the old body
+# instead of stranding it for the life of the process.
+_doc_cache_key_for_source: dict[str, str] = {}
+
+
+def _memoized_fetch(
+    source: str,
+    factory: Callable[[], Awaitable["RawDocument"]],
+    version: str = "",
+) -> "asyncio.Task":
+    """Return the cached (possibly in-flight) fetch task for ``source``,
+    or schedule a new one via ``factory``. Failed fetches are not cached.
+
+    When the caller knows the upstream revision (``version``, e.g. a git
+    blob sha), it joins the cache key: a re-discover that lists a new
+    sha then misses here and reaches the sha/ETag logic below, instead
+    of the TTL pinning the superseded body for an hour. Source-only
+    keying remains for callers without a revision, which still
+    coalesces concurrent duplicate fetches. Inserting a new revision
+    drops the superseded entry for the same source, and expired entries
+    are swept once the cache grows large.
+    """
+    key = f"{source}#{version}" if version else source
+    now = time.monotonic()
+    entry = _doc_cache.get(key)
+    if entry is not None:
+        ts, task = entry
+        fresh = now - ts < _DOC_CACHE_TTL
+        failed = task.done() and (task.cancelled() or task.exception() is not None)
+        if fresh and not failed:
+            return task
+
+    old_key = _doc_cache_key_for_source.get(source)
+    if old_key is not None and old_key != key:
+        _doc_cache.pop(old_key, None)
+    _doc_cache_key_for_source[source] = key
+
+    if len(_doc_cache) >= _DOC_CACHE_SWEEP_SIZE:
+        for stale in [
+            k for k, (ts, _) in _doc_cache.items()
+            if now - ts >= _DOC_CACHE_TTL
+        ]:
+            del _doc_cache[stale]
+        for src in [
+            s for s, k in _doc_cache_key_for_source.items()
+            if k not in _doc_cache
+        ]:
+            del _doc_cache_key_for_source[src]
+
+    task = asyncio.ensure_future(factory())
+    _doc_cache[key] = (now, task)
+    return task
+
 
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
+# Directories that dwarf the real source tree (dependency caches, build
+# output, VCS internals) — pruned before descent so their contents are
+# never even listed.
+_SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", ".venv", "venv", "node_modules",
+    "__pycache__", "build", "dist", "target", ".idea", ".vscode",
+})
+
+
+def _iter_local_files(root: Path, suffixes: tuple[str, ...]):
+    """Yield ``(path, mtime_ns, size)`` for files under ``root`` matching
+    ``suffixes``.
+
+    Iterative os.scandir walk: DirEntry type checks and stat results come
+    from the directory read itself, avoiding the per-entry Path
+    construction and extra stat calls that make pathlib.rglob the slow
+    path on big trees. The fingerprint fields feed the unchanged-file
+    short-circuit in :func:`_scan_and_read`.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                # Cheapest reject first: the suffix test is pure string
+                # work, so mismatched names never pay the is_file check
+                elif name.endswith(suffixes) and entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    yield entry.path, st.st_mtime_ns, st.st_size
+
+
+def _safe_read(path: str) -> Optional[str]:
+    """Read a file as UTF-8, returning None (and warning) on failure.
+
+    Reads raw bytes and decodes once — TextIOWrapper's incremental
+    decoder and newline translation cost real CPU per file and buy
+    nothing for a whole-file read. A NUL in the first 4 KiB (the classic
+    file(1)/ripgrep heuristic) rejects binaries that slipped past the
+    extension filter without reading or decoding the rest.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4096)
+            if b"\x00" in head:
+                logger.warning("Skipping %s: binary content", path)
+                return None
+            return (head + f.read()).decode("utf-8")
+    except (UnicodeDecodeError, OSError) as e:
+        logger.warning("Skipping %s: %s", path, e)
+        return None
+
+
+# Above this many files, the UTF-8 decode work starts to dominate the
+# I/O and threads serialize on the GIL — shard across processes instead.
+_PROCESS_READ_THRESHOLD = 5000
+
+
+def _read_chunk(paths: list[str]) -> list[tuple[str, str]]:
+    """Read a shard of paths; process-pool worker for huge trees."""
+    return [
+        (path, content)
+        for path, content in zip(paths, map(_safe_read, paths))
+        if content is not None
+    ]
+
+
+def _read_local_files(paths: list[str]) -> list[tuple[str, str]]:
+    """Read many local files concurrently.
+
+    The GIL is released during read(), so a thread pool lets the kernel
+    service many small-file reads at once. Very large trees shard
+    round-robin across a process pool so the decode work scales with
+    cores. Returns (path, content) pairs for the files that could be
+    read.
+    """
+    if not paths:
+        return []
+
+    if len(paths) >= _PROCESS_READ_THRESHOLD:
+        workers = os.cpu_count() or 4
+        shards = [paths[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(itertools.chain.from_iterable(
+                executor.map(_read_chunk, shards)
+            ))
+
+    workers = min(32, (os.cpu_count() or 4) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = executor.map(_safe_read, paths)
+        return [
+            (path, content)
+            for path, content in zip(paths, contents)
+            if content is not None
+        ]
+
+
+def _scan_and_read(root: Path, suffixes: tuple[str, ...]) -> list[tuple[str, str]]:
+    """Walk ``root`` and return (path, content) pairs, skipping reads for
+    files whose (mtime_ns, size) fingerprint matches the sidecar cache.
+
+    The local analogue of the GitHub connector's ETag/sha cache:
+    unchanged files on a re-ingest cost only the scandir stat, not a
+    read. Deleted files fall out of the cache on the next save.
+
+    The sidecar is keyed by the scanned root (data/code and data/docs
+    are walked concurrently during discovery; a shared file would let
+    whichever scan finished last clobber the other's entries).
+    """
+    cache_path = root.parent / f".local_ingest_cache-{root.name}.json"
+    try:
+        cache = orjson.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+
+    results: list[tuple[str, str]] = []
+    fresh_cache: dict[str, dict] = {}
+    to_read: list[tuple[str, int, int]] = []
+    for path, mtime_ns, size in _iter_local_files(root, suffixes):
+        entry = cache.get(path)
+        if entry and entry.get("mtime_ns") == mtime_ns and entry.get("size") == size:
+            results.append((path, entry["content"]))
+            fresh_cache[path] = entry
+        else:
+            to_read.append((path, mtime_ns, size))
+
+    if to_read:
+        read_map = dict(_read_local_files([p for p, _, _ in to_read]))
+        for path, mtime_ns, size in to_read:
+            content = read_map.get(path)
+            if content is None:
+                continue
+            fresh_cache[path] = {"mtime_ns": mtime_ns, "size": size, "content": content}
+            results.append((path, content))
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(orjson.dumps(fresh_cache))
+    except OSError as e:
+        logger.warning("Could not write local ingest cache %s: %s", cache_path, e)
+
+    return results
+
+
 class RawDocument(BaseModel):
     """A raw document fetched from any data source."""
     content: str
@@ -30,11 +334,32 @@ class RawDocument(BaseModel):
     file_type: str         # e.g. "java", "ts", "md", "html"
     metadata: dict = Field(default_factory=dict)
 
+    def text(self) -> str:
+        """Return the document body.
+
+        Large bodies are spilled to disk by the connectors and carry an
+        empty ``content`` plus a ``local_path`` in metadata; those are
+        read lazily here so they only occupy memory while being chunked.
+        """
+        if self.content or "local_path" not in self.metadata:
+            return self.content
+        try:
+            return Path(self.metadata["local_path"]).read_text(
+                encoding="utf-8", errors="replace"
+            )
+        except OSError as e:
+            logger.warning("Could not read spilled body %s: %s", self.metadata["local_path"], e)
+            return ""
+
 
 # ---------------------------------------------------------------------------
 # GitHub Connector
 # ---------------------------------------------------------------------------
 
+# Default code suffixes, pre-normalized for str.endswith
+_DEFAULT_CODE_SUFFIXES = (".java", ".js", ".jsx", ".py", ".ts", ".tsx")
+
+
 class GitHubConnector:
     """
     Fetches source code files from a GitHub repository.
@@ -50,23 +375,27 @@ class GitHubConnector:
         self.token = token or os.getenv("GITHUB_TOKEN", "")
         self.repo = repo or os.getenv("GITHUB_REPO", "")
         self.local_dir = Path(local_dir)
-        self._client: Optional[httpx.AsyncClient] = None
+        # Sidecar cache of fetched bodies (keyed by source) so unchanged
+        # files cost a 304 — or nothing at all when the blob sha matches.
+        self.cache_path = self.local_dir.parent / ".ingest_cache.json"
+        self._cache: dict[str, dict] = {}
+        # Normalized once here so the per-entry hot loops do a single
+        # endswith(tuple) test with no set construction or rsplit work
+        self._ext_suffixes: tuple[str, ...] = _DEFAULT_CODE_SUFFIXES
 
     @property
     def is_live(self) -> bool:
         return bool(self.token and self.repo)
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url="https://api.github.com",
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                    "Accept": "application/vnd.github.v3+json",
-                },
-                timeout=30.0,
-            )
-        return self._client
+        return _get_shared_client(
+            "https://api.github.com",
+            self.token,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+        )
 
     async def fetch_files(
         self,
@@ -81,85 +410,344 @@ class GitHubConnector:
             extensions: File extensions to include (e.g. {".java", ".ts"}).
                         If None, includes all supported code extensions.
         """
+        return [doc async for doc in self.iter_files(path, extensions)]
+
+    async def iter_files(
+        self,
+        path: str = "",
+        extensions: set[str] | None = None,
+    ) -> AsyncIterator[RawDocument]:
+        """
+        Stream code files as they become available.
+
+        Unlike :meth:`fetch_files`, documents are yielded one at a time (in
+        download-completion order for live repos), so downstream pipelines
+        can start chunking before the whole corpus is in memory.
+        """
         if extensions is None:
-            extensions = {".java", ".ts", ".tsx", ".py", ".js", ".jsx"}
+            ext_suffixes = self._ext_suffixes
+        else:
+            ext_suffixes = tuple(sorted(
+                e if e.startswith(".") else "." + e for e in extensions
+            ))
+
+        if not self.is_live:
+            # The walk + reads are blocking filesystem work; run them in a
+            # thread so concurrent fetches (docs, other requests) proceed
+            for doc in await asyncio.to_thread(
+                list, self._fetch_from_local(ext_suffixes)
+            ):
+                yield doc
+            return
+
+        self._cache = self._load_cache()
+        try:
+            if path:
+                # Subtree scans use the queue-driven Contents walk
+                for doc in await self._fetch_from_github(path, ext_suffixes):
+                    yield doc
+                return
+
+            targets = await self._list_tree(ext_suffixes)
+            if targets is None:
+                # Truncated tree listing: the Contents walk handles any
+                # repo size, one directory at a time.
+                for doc in await self._fetch_from_github("", ext_suffixes):
+                    yield doc
+                return
+
+            tasks = [
+                asyncio.ensure_future(self._download_tree_entry(entry))
+                for entry in targets
+            ]
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            self._save_cache()
+
+    # ------------------------------------------------------------------
+    # Conditional-request cache
+    # ------------------------------------------------------------------
+
+    def _load_cache(self) -> dict[str, dict]:
+        try:
+            return orjson.loads(self.cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_bytes(orjson.dumps(self._cache))
+        except OSError as e:
+            logger.warning("Could not write ingest cache %s: %s", self.cache_path, e)
+
+    def _cached_document(self, source: str, file_ext: str, metadata: dict) -> RawDocument:
+        cached = self._cache[source]
+        return RawDocument.model_construct(
+            content=cached["content"],
+            source=source,
+            file_type=file_ext.lstrip("."),
+            metadata=metadata,
+        )
+
+    async def _fetch_body(
+        self,
+        url: str,
+        source: str,
+        sha: str,
+        file_ext: str,
+        metadata: dict,
+    ) -> RawDocument:
+        """Fetch a file body through the in-process memoizer (shared
+        in-flight request per source, TTL reuse across runs)."""
+        return await _memoized_fetch(
+            source,
+            lambda: self._fetch_body_uncached(url, source, sha, file_ext, metadata),
+            version=sha,
+        )
+
+    async def _fetch_body_uncached(
+        self,
+        url: str,
+        source: str,
+        sha: str,
+        file_ext: str,
+        metadata: dict,
+    ) -> RawDocument:
+        """Download a file body, short-circuiting on sha match or 304."""
+        # Large bodies never enter memory (or the JSON sidecar) whole —
+        # they stream straight to a spool file read lazily downstream.
+        if metadata.get("size", 0) > _STREAM_THRESHOLD:
+            return await self._stream_to_disk(url, source, sha, file_ext, metadata)
+
+        cached = self._cache.get(source)
+
+        # Blob sha already known from the listing — skip the request outright
+        if cached and sha and cached.get("sha") == sha:
+            return self._cached_document(source, file_ext, metadata)
+
+        # The raw media type makes the Contents endpoint return the file
+        # bytes directly — one round-trip, no base64 JSON wrapper and no
+        # redirect to raw.githubusercontent.com.
+        headers = {"Accept": "application/vnd.github.raw+json"}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
 
-        if self.is_live:
-            return await self._fetch_from_github(path, extensions)
-        return self._fetch_from_local(extensions)
+        client = await self._get_client()
+        file_resp = await _get_with_retry(client, url, headers=headers or None)
+
+        if file_resp.status_code == 304 and cached:
+            return self._cached_document(source, file_ext, metadata)
+        file_resp.raise_for_status()
+
+        self._cache[source] = {
+            "etag": file_resp.headers.get("etag", ""),
+            "sha": sha,
+            "content": file_resp.text,
+        }
+        return RawDocument.model_construct(
+            content=file_resp.text,
+            source=source,
+            file_type=file_ext.lstrip("."),
+            metadata=metadata,
+        )
+
+    async def _stream_to_disk(
+        self,
+        url: str,
+        source: str,
+        sha: str,
+        file_ext: str,
+        metadata: dict,
+    ) -> RawDocument:
+        """Stream a large file body to a spool file in 64 KiB chunks.
+
+        The returned document has ``content=""`` and a ``local_path`` in
+        metadata; :meth:`RawDocument.text` reads it back on demand.
+        """
+        spool_dir = self.local_dir.parent / ".ingest_blobs"
+        dest = spool_dir / f"{sha or 'nosha'}{file_ext}"
+
+        # An existing spool file for the same blob sha is already current
+        if not (sha and dest.exists()):
+            spool_dir.mkdir(parents=True, exist_ok=True)
+            # Stream into a temp name and rename on success: a failed
+            # download must never leave a partial file under the final
+            # name, where the sha-exists check would treat it as the
+            # complete body on every later run.
+            tmp = dest.with_name(dest.name + ".part")
+            client = await self._get_client()
+            headers = {"Accept": "application/vnd.github.raw+json"}
+            try:
+                async with _fetch_semaphore:
+                    async with client.stream("GET", url, headers=headers) as resp:
+                        resp.raise_for_status()
+                        with open(tmp, "wb") as f:
+                            async for chunk in resp.aiter_bytes(65536):
+                                f.write(chunk)
+                os.replace(tmp, dest)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+
+        return RawDocument.model_construct(
+            content="",
+            source=source,
+            file_type=file_ext.lstrip("."),
+            metadata={**metadata, "local_path": str(dest)},
+        )
+
+    async def _list_tree(self, ext_suffixes: tuple[str, ...]) -> list[dict] | None:
+        """List every matching blob with one Git Trees API call.
+
+        ``/git/trees/HEAD?recursive=1`` returns every blob path in a single
+        response, replacing the O(directories) Contents walk. Returns None
+        when the API marks the listing truncated (repo over the Trees
+        entry/size limit) — a truncated list would silently drop every
+        file past the cutoff, so the caller must fall back to the walk.
+        """
+        client = await self._get_client()
+        url = f"/repos/{self.repo}/git/trees/HEAD"
+        response = await _get_with_retry(client, url, params={"recursive": "1"})
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        if data.get("truncated"):
+            logger.warning(
+                "Git Trees listing for %s is truncated; falling back to the "
+                "Contents walk", self.repo,
+            )
+            return None
+
+        return [
+            entry
+            for entry in data.get("tree", [])
+            if entry.get("type") == "blob" and entry.get("path", "").endswith(ext_suffixes)
+        ]
+
+    async def _download_tree_entry(self, entry: dict) -> RawDocument:
+        """Download one tree blob via the Git Blobs API.
+
+        The raw media type returns the decoded file bytes directly, and the
+        request reuses the pooled api.github.com connection from the tree
+        listing — no second host, no extra TLS handshake."""
+        blob_url = f"/repos/{self.repo}/git/blobs/{entry['sha']}"
+        file_ext = "." + entry["path"].rsplit(".", 1)[-1] if "." in entry["path"] else ""
+        return await self._fetch_body(
+            url=blob_url,
+            source=f"github:{self.repo}/{entry['path']}",
+            sha=entry.get("sha", ""),
+            file_ext=file_ext,
+            metadata={
+                "sha": entry.get("sha", ""),
+                "size": entry.get("size", 0),
+                "url": f"https://github.com/{self.repo}/blob/HEAD/{entry['path']}",
+            },
+        )
 
     async def _fetch_from_github(
         self,
         path: str,
-        extensions: set[str],
+        ext_suffixes: tuple[str, ...],
     ) -> list[RawDocument]:
-        """Recursively fetch files from GitHub Contents API."""
-        client = await self._get_client()
-        url = f"/repos/{self.repo}/contents/{path}"
-        response = await client.get(url)
-        response.raise_for_status()
-
-        items = response.json()
-        if not isinstance(items, list):
-            items = [items]
+        """Fetch files under a subtree via the GitHub Contents API.
 
+        A fixed pool of workers drains a queue of directory paths: each
+        worker lists one directory, enqueues its subdirectories, and
+        downloads its matching files. Peak concurrency is therefore
+        predictable (pool size × semaphore bound) regardless of tree
+        shape, unlike an unbounded recursive gather.
+        """
+        client = await self._get_client()
+        dir_queue: asyncio.Queue[str] = asyncio.Queue()
+        dir_queue.put_nowait(path)
         documents: list[RawDocument] = []
+        errors: list[Exception] = []
+
+        async def _fetch_file(item: dict, file_ext: str) -> RawDocument:
+            # Re-request the Contents path with the raw media type instead
+            # of following download_url to a different host.
+            return await self._fetch_body(
+                url=f"/repos/{self.repo}/contents/{item['path']}",
+                source=f"github:{self.repo}/{item['path']}",
+                sha=item.get("sha", ""),
+                file_ext=file_ext,
+                metadata={
+                    "sha": item.get("sha", ""),
+                    "size": item.get("size", 0),
+                    "url": item.get("html_url", ""),
+                },
+            )
 
-        for item in items:
-            if item["type"] == "dir":
-                sub_docs = await self._fetch_from_github(item["path"], extensions)
-                documents.extend(sub_docs)
-            elif item["type"] == "file":
-                file_ext = "." + item["name"].rsplit(".", 1)[-1] if "." in item["name"] else ""
-                if file_ext in extensions:
-                    # Fetch file content
-                    file_resp = await client.get(item["download_url"])
-                    file_resp.raise_for_status()
-                    documents.append(RawDocument(
-                        content=file_resp.text,
-                        source=f"github:{self.repo}/{item['path']}",
-                        file_type=file_ext.lstrip("."),
-                        metadata={
-                            "sha": item.get("sha", ""),
-                            "size": item.get("size", 0),
-                            "url": item.get("html_url", ""),
-                        },
-                    ))
-
+        async def _walk_dir(dir_path: str) -> None:
+            response = await _get_with_retry(
+                client, f"/repos/{self.repo}/contents/{dir_path}"
+            )
+            response.raise_for_status()
+            items = orjson.loads(response.content)
+            if not isinstance(items, list):
+                items = [items]
+
+            file_tasks = []
+            for item in items:
+                if item["type"] == "dir":
+                    dir_queue.put_nowait(item["path"])
+                elif item["type"] == "file" and item["name"].endswith(ext_suffixes):
+                    # endswith on a tuple is one C-level pass — no per-entry
+                    # substring allocation like rsplit + set membership
+                    file_ext = "." + item["name"].rsplit(".", 1)[-1]
+                    file_tasks.append(_fetch_file(item, file_ext))
+            documents.extend(await asyncio.gather(*file_tasks))
+
+        async def _worker() -> None:
+            while True:
+                dir_path = await dir_queue.get()
+                try:
+                    await _walk_dir(dir_path)
+                except Exception as e:
+                    errors.append(e)
+                finally:
+                    dir_queue.task_done()
+
+        workers = [
+            asyncio.create_task(_worker()) for _ in range(_FETCH_CONCURRENCY)
+        ]
+        try:
+            await dir_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        if errors:
+            raise errors[0]
         return documents
 
-    def _fetch_from_local(self, extensions: set[str]) -> list[RawDocument]:
-        """Read code files from the local data/ directory."""
-        documents: list[RawDocument] = []
-
+    def _fetch_from_local(self, ext_suffixes: tuple[str, ...]) -> Iterator[RawDocument]:
+        """Stream code files from the local data/ directory."""
         if not self.local_dir.exists():
-            return documents
-
-        for file_path in self.local_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix in extensions:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    documents.append(RawDocument(
-                        content=content,
-                        source=f"local:{file_path}",
-                        file_type=file_path.suffix.lstrip("."),
-                        metadata={"local_path": str(file_path)},
-                    ))
-                except (UnicodeDecodeError, OSError) as e:
-                    print(f"⚠️  Skipping {file_path}: {e}")
-
-        return documents
+            return
+
+        for file_path, content in _scan_and_read(self.local_dir, ext_suffixes):
+            yield RawDocument.model_construct(
+                content=content,
+                source=f"local:{file_path}",
+                file_type=file_path.rsplit(".", 1)[-1],
+                metadata={"local_path": file_path},
+            )
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Clients are pooled at module level; see aclose_shared_clients()."""
 
 
 # ---------------------------------------------------------------------------
 # Confluence Connector
 # ---------------------------------------------------------------------------
 
+# Default documentation suffixes, pre-normalized for str.endswith
+_DOC_SUFFIXES = (".html", ".md", ".rst", ".txt")
+
+
 class ConfluenceConnector:
     """
     Fetches documentation pages from Confluence.
@@ -177,99 +765,115 @@ class ConfluenceConnector:
         self.token = token or os.getenv("CONFLUENCE_TOKEN", "")
         self.space_key = space_key or os.getenv("CONFLUENCE_SPACE_KEY", "")
         self.local_dir = Path(local_dir)
-        self._client: Optional[httpx.AsyncClient] = None
 
     @property
     def is_live(self) -> bool:
         return bool(self.url and self.token)
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.url,
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                    "Accept": "application/json",
-                },
-                timeout=30.0,
-            )
-        return self._client
+        return _get_shared_client(
+            self.url,
+            self.token,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/json",
+            },
+        )
 
     async def fetch_pages(self) -> list[RawDocument]:
         """
         Fetch documentation pages from Confluence API or local fallback.
         """
-        if self.is_live:
-            return await self._fetch_from_confluence()
-        return self._fetch_from_local()
+        return [doc async for doc in self.iter_pages()]
 
-    async def _fetch_from_confluence(self) -> list[RawDocument]:
-        """Fetch pages from Confluence REST API v2."""
+    async def iter_pages(self) -> AsyncIterator[RawDocument]:
+        """
+        Stream documentation pages one at a time, so downstream chunking
+        can start before every page body has been fetched.
+        """
+        if self.is_live:
+            async for doc in self._iter_from_confluence():
+                yield doc
+            return
+        # Blocking filesystem work — keep it off the event loop
+        for doc in await asyncio.to_thread(list, self._fetch_from_local()):
+            yield doc
+
+    async def _paginate(self, url: str, params: Optional[dict]) -> AsyncIterator[dict]:
+        """Yield results from a Confluence v2 listing, following _links.next."""
         client = await self._get_client()
-        documents: list[RawDocument] = []
-
-        # Paginate through space content
-        url = "/wiki/api/v2/spaces"
-        params = {"keys": self.space_key, "limit": 25}
-
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-
-        for space in data.get("results", []):
-            space_id = space["id"]
-            pages_url = f"/wiki/api/v2/spaces/{space_id}/pages"
-            pages_resp = await client.get(pages_url, params={"limit": 100})
-            pages_resp.raise_for_status()
-
-            for page in pages_resp.json().get("results", []):
-                # Fetch page body
-                body_url = f"/wiki/api/v2/pages/{page['id']}?body-format=storage"
-                body_resp = await client.get(body_url)
-                body_resp.raise_for_status()
-                body_data = body_resp.json()
-
-                content = body_data.get("body", {}).get("storage", {}).get("value", "")
-                documents.append(RawDocument(
-                    content=content,
-                    source=f"confluence:{self.space_key}/{page['title']}",
-                    file_type="html",
-                    metadata={
-                        "page_id": page["id"],
-                        "title": page["title"],
-                        "space": self.space_key,
-                    },
-                ))
-
-        return documents
-
-    def _fetch_from_local(self) -> list[RawDocument]:
-        """Read documentation files from the local data/docs/ directory."""
-        documents: list[RawDocument] = []
-        doc_extensions = {".md", ".html", ".txt", ".rst"}
-
+        while url:
+            response = await _get_with_retry(client, url, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            for item in data.get("results", []):
+                yield item
+            # The next link already carries the cursor query string
+            url = data.get("_links", {}).get("next", "")
+            params = None
+
+    async def _fetch_page_body(self, page: dict) -> RawDocument:
+        """Fetch one page's storage-format body (memoized per page)."""
+        source = f"confluence:{self.space_key}/{page['title']}"
+        return await _memoized_fetch(
+            source, lambda: self._fetch_page_body_uncached(page)
+        )
+
+    async def _fetch_page_body_uncached(self, page: dict) -> RawDocument:
+        """Fetch one page's storage-format body."""
+        client = await self._get_client()
+        body_url = f"/wiki/api/v2/pages/{page['id']}"
+        body_resp = await _get_with_retry(client, body_url, params={"body-format": "storage"})
+        body_resp.raise_for_status()
+        body_data = orjson.loads(body_resp.content)
+
+        content = body_data.get("body", {}).get("storage", {}).get("value", "")
+        return RawDocument.model_construct(
+            content=content,
+            source=f"confluence:{self.space_key}/{page['title']}",
+            file_type="html",
+            metadata={
+                "page_id": page["id"],
+                "title": page["title"],
+                "space": self.space_key,
+            },
+        )
+
+    async def _iter_from_confluence(self) -> AsyncIterator[RawDocument]:
+        """Stream pages from Confluence REST API v2.
+
+        Listings are fully paginated (the old code silently stopped at the
+        first 100 pages), and the N body fetches fan out concurrently
+        instead of running as a nested sequential loop.
+        """
+        pages: list[dict] = []
+        async for space in self._paginate(
+            "/wiki/api/v2/spaces", {"keys": self.space_key, "limit": 25}
+        ):
+            async for page in self._paginate(
+                f"/wiki/api/v2/spaces/{space['id']}/pages", {"limit": 100}
+            ):
+                pages.append(page)
+
+        tasks = [asyncio.ensure_future(self._fetch_page_body(page)) for page in pages]
+        for future in asyncio.as_completed(tasks):
+            yield await future
+
+    def _fetch_from_local(self) -> Iterator[RawDocument]:
+        """Stream documentation files from the local data/docs/ directory."""
         if not self.local_dir.exists():
-            return documents
-
-        for file_path in self.local_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix in doc_extensions:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    documents.append(RawDocument(
-                        content=content,
-                        source=f"local:{file_path}",
-                        file_type=file_path.suffix.lstrip("."),
-                        metadata={
-                            "local_path": str(file_path),
-                            "title": file_path.stem,
-                        },
-                    ))
-                except (UnicodeDecodeError, OSError) as e:
-                    print(f"⚠️  Skipping {file_path}: {e}")
-
-        return documents
+            return
+
+        for file_path, content in _scan_and_read(self.local_dir, _DOC_SUFFIXES):
+            yield RawDocument.model_construct(
+                content=content,
+                source=f"local:{file_path}",
+                file_type=file_path.rsplit(".", 1)[-1],
+                metadata={
+                    "local_path": file_path,
+                    "title": os.path.splitext(os.path.basename(file_path))[0],
+                },
+            )
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Clients are pooled at module level; see aclose_shared_clients()."""
@@ -7,11 +7,16 @@ and querying with metadata filters.
 
 from __future__ import annotations
 
+import hashlib
 import os
+from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
@@ -39,8 +44,10 @@ class VectorStore:
     ChromaDB wrapper providing collection-per-skill management,
     chunk upserting, and filtered search.
 
-    Uses ChromaDB's default embedding function (all-MiniLM-L6-v2)
-    for the MVP. Can be swapped for OpenAI/Cohere embeddings later.
+    Embeds with the ONNX Runtime build of all-MiniLM-L6-v2 — same
+    vectors as the PyTorch default, but int8-quantized kernels that run
+    several times faster on CPU with a fraction of the footprint. Can be
+    swapped for OpenAI/Cohere embeddings later.
     """
 
     def __init__(
@@ -54,6 +61,18 @@ class VectorStore:
             path=self.persist_dir,
             settings=Settings(anonymized_telemetry=False),
         )
+        self._embed_fn = ONNXMiniLM_L6_V2(
+            preferred_providers=["CPUExecutionProvider"]
+        )
+        # Content hashes of everything already upserted, per collection —
+        # lets incremental ingests skip re-embedding unchanged chunks.
+        self._hash_path = Path(self.persist_dir) / ".upsert_hashes.json"
+        try:
+            self._upsert_hashes: dict[str, dict[str, str]] = orjson.loads(
+                self._hash_path.read_bytes()
+            )
+        except (OSError, ValueError):
+            self._upsert_hashes = {}
 
     # ------------------------------------------------------------------
     # Collection management
@@ -67,7 +86,19 @@ class VectorStore:
         collection_name = self._normalize_name(skill_name)
         return self._client.get_or_create_collection(
             name=collection_name,
-            metadata={"skill": skill_name},
+            # HNSW tuning: cosine matches the normalized MiniLM vectors;
+            # M=16 / ef=100 build a denser graph once at ingest time so
+            # queries get away with a modest search_ef, and the index
+            # parallelizes across cores. Applied on first creation only.
+            metadata={
+                "skill": skill_name,
+                "hnsw:space": "cosine",
+                "hnsw:M": 16,
+                "hnsw:construction_ef": 100,
+                "hnsw:search_ef": 64,
+                "hnsw:num_threads": os.cpu_count() or 4,
+            },
+            embedding_function=self._embed_fn,
         )
 
     def delete_collection(self, skill_name: str) -> None:
@@ -77,6 +108,9 @@ class VectorStore:
             self._client.delete_collection(collection_name)
         except ValueError:
             pass  # Collection doesn't exist
+        # Drop the recorded hashes so a re-created collection is refilled
+        if self._upsert_hashes.pop(collection_name, None) is not None:
+            self._save_hashes()
 
     def list_collections(self) -> list[str]:
         """List all collection names in the vector store."""
@@ -97,71 +131,166 @@ class VectorStore:
 
         Each chunk dict must have: 'id', 'content', and optionally 'metadata'.
 
+        Chunks whose content hash matches what was last upserted are
+        skipped outright, so incremental re-ingests only pay for the
+        delta. Embeddings are computed here in one batch and handed to
+        Chroma directly rather than recomputed inside the collection.
+
         Args:
             skill_name: The skill collection to write to.
             chunks:     List of chunk dicts.
 
         Returns:
-            Number of chunks upserted.
+            Number of chunks actually upserted (changed or new).
         """
         if not chunks:
             return 0
 
         collection = self.get_or_create_collection(skill_name)
+        known = self._upsert_hashes.setdefault(collection.name, {})
 
-        ids = [c["id"] for c in chunks]
-        documents = [c["content"] for c in chunks]
-        metadatas = [c.get("metadata", {}) for c in chunks]
+        changed: list[tuple[dict[str, Any], str]] = []
+        for c in chunks:
+            digest = hashlib.blake2b(
+                c["content"].encode("utf-8"), digest_size=16
+            ).hexdigest()
+            if known.get(c["id"]) != digest:
+                changed.append((c, digest))
 
-        # ChromaDB handles batch sizes internally
+        if not changed:
+            return 0
+
+        documents = [c["content"] for c, _ in changed]
         collection.upsert(
-            ids=ids,
+            ids=[c["id"] for c, _ in changed],
             documents=documents,
-            metadatas=metadatas,
+            embeddings=self._embed_fn(documents),
+            metadatas=[c.get("metadata", {}) for c, _ in changed],
         )
-        return len(chunks)
 
-    def query(
+        for c, digest in changed:
+            known[c["id"]] = digest
+        self._save_hashes()
+        return len(changed)
+
+    def _save_hashes(self) -> None:
+        """Persist the per-collection content hashes beside the store."""
+        try:
+            self._hash_path.parent.mkdir(parents=True, exist_ok=True)
+            self._hash_path.write_bytes(orjson.dumps(self._upsert_hashes))
+        except OSError:
+            pass  # Cache is best-effort; worst case is a re-embed next run
+
+    def query_batch_dicts(
         self,
         skill_name: str,
-        query_text: str,
+        query_texts: list[str],
         n_results: int = 5,
         metadata_filter: Optional[dict] = None,
-    ) -> list[QueryResult]:
+    ) -> list[list[dict]]:
         """
-        Query the vector store for relevant chunks.
+        Run several queries against a collection in one call, as dicts.
+
+        Chroma embeds the whole batch at once (one matrix multiply
+        instead of N vector ones) and traverses the HNSW index per
+        query without N round-trips, so multi-hop / re-ranking callers
+        should pass all their sub-queries together. Results are plain
+        dicts built straight off Chroma's columnar response — callers
+        that ship JSON (the ADK tools) skip the Pydantic
+        materialize-then-model_dump round trip entirely.
 
         Args:
             skill_name:      Collection to search in.
-            query_text:      The query string.
-            n_results:       Number of results to return.
+            query_texts:     The query strings.
+            n_results:       Number of results to return per query.
             metadata_filter: Optional ChromaDB where-filter dict.
 
         Returns:
-            List of QueryResult objects ranked by relevance.
+            One list of result dicts per query, in input order; each
+            dict has 'id', 'content', 'score', and 'metadata'.
         """
+        if not query_texts:
+            return []
+
         collection = self.get_or_create_collection(skill_name)
 
+        # No count() pre-flight — that's an extra store scan per query,
+        # and Chroma simply returns fewer results than requested when the
+        # collection is smaller than n_results.
         query_params: dict[str, Any] = {
-            "query_texts": [query_text],
-            "n_results": min(n_results, collection.count() or 1),
+            "query_texts": query_texts,
+            "n_results": n_results,
         }
         if metadata_filter:
             query_params["where"] = metadata_filter
 
         results = collection.query(**query_params)
 
-        query_results: list[QueryResult] = []
-        if results["ids"] and results["ids"][0]:
-            for idx, doc_id in enumerate(results["ids"][0]):
-                query_results.append(QueryResult(
-                    id=doc_id,
-                    content=results["documents"][0][idx] if results["documents"] else "",
-                    score=1.0 - (results["distances"][0][idx] if results["distances"] else 0.0),
-                    metadata=results["metadatas"][0][idx] if results["metadatas"] else {},
-                ))
-
-        return query_results
+        batches: list[list[dict]] = []
+        for q_idx, ids in enumerate(results["ids"] or []):
+            query_results: list[dict] = []
+            for idx, doc_id in enumerate(ids):
+                query_results.append({
+                    "id": doc_id,
+                    "content": results["documents"][q_idx][idx] if results["documents"] else "",
+                    "score": 1.0 - (results["distances"][q_idx][idx] if results["distances"] else 0.0),
+                    "metadata": results["metadatas"][q_idx][idx] if results["metadatas"] else {},
+                })
+            batches.append(query_results)
+
+        return batches
+
+    def query_batch(
+        self,
+        skill_name: str,
+        query_texts: list[str],
+        n_results: int = 5,
+        metadata_filter: Optional[dict] = None,
+    ) -> list[list[QueryResult]]:
+        """Like :meth:`query_batch_dicts`, wrapped as QueryResult objects."""
+        return [
+            [QueryResult.model_construct(**d) for d in batch]
+            for batch in self.query_batch_dicts(
+                skill_name, query_texts, n_results, metadata_filter
+            )
+        ]
+
+    def query_dicts(
+        self,
+        skill_name: str,
+        query_text: str,
+        n_results: int = 5,
+        metadata_filter: Optional[dict] = None,
+    ) -> list[dict]:
+        """Single-query form of :meth:`query_batch_dicts`."""
+        batches = self.query_batch_dicts(
+            skill_name, [query_text], n_results, metadata_filter
+        )
+        return batches[0] if batches else []
+
+    def query(
+        self,
+        skill_name: str,
+        query_text: str,
+        n_results: int = 5,
+        metadata_filter: Optional[dict] = None,
+    ) -> list[QueryResult]:
+        """
+        Query the vector store for relevant chunks.
+
+        Args:
+            skill_name:      Collection to search in.
+            query_text:      The query string.
+            n_results:       Number of results to return.
+            metadata_filter: Optional ChromaDB where-filter dict.
+
+        Returns:
+            List of QueryResult objects ranked by relevance.
+        """
+        batches = self.query_batch(
+            skill_name, [query_text], n_results, metadata_filter
+        )
+        return batches[0] if batches else []
 
     # ------------------------------------------------------------------
     # Utilities
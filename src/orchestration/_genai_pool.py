@@ -0,0 +1,58 @@
+"""
+_genai_pool.py — Process-wide pool of google.generativeai model handles.
+
+``genai.GenerativeModel`` construction re-runs schema setup and
+credential resolution each time; the handles themselves are stateless
+and safe to share, so every caller in the pipeline reuses one instance
+per model id.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+import google.generativeai as genai
+
+
+@lru_cache(maxsize=1)
+def _configure() -> bool:
+    """Point the shared genai client at GOOGLE_API_KEY, exactly once.
+
+    ``transport="grpc_asyncio"`` pins every call onto one persistent
+    async gRPC channel (HTTP/2, multiplexed) held for the life of the
+    process, so council fan-out and chat turns share warm connections
+    instead of paying TCP + TLS setup per cold call. All generation in
+    this codebase goes through ``generate_content_async``, so the
+    async-only transport is safe.
+    """
+    api_key = os.getenv("GOOGLE_API_KEY", "")
+    if api_key:
+        genai.configure(api_key=api_key, transport="grpc_asyncio")
+    return bool(api_key)
+
+
+_model_pool: dict[tuple[str, str | None], genai.GenerativeModel] = {}
+
+
+def get_model(
+    model_id: str,
+    system_instruction: str | None = None,
+) -> genai.GenerativeModel:
+    """Return the shared GenerativeModel for ``model_id``.
+
+    Passing the (stable) instruction as ``system_instruction`` instead
+    of pasting it into each prompt keeps the constant prefix in a
+    dedicated slot the provider can recognise across calls — which is
+    what lets Gemini's implicit prompt caching reuse KV state for it.
+    Handles are pooled per (model, instruction); instructions are
+    static per agent, so the pool stays small.
+    """
+    key = (model_id, system_instruction)
+    model = _model_pool.get(key)
+    if model is None:
+        _configure()
+        model = _model_pool[key] = genai.GenerativeModel(
+            model_id, system_instruction=system_instruction
+        )
+    return model
@@ -9,10 +9,11 @@ from __future__ import annotations
 
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 load_dotenv()
 
@@ -70,29 +71,30 @@ class AgentConfig(BaseModel):
     max_tokens: int = 4096
 
 
+# Environment defaults resolved once at import (load_dotenv has already
+# run above); avoids re-running five default_factory lambdas per
+# PipelineConfig() and lets Pydantic validate the defaults at schema
+# build rather than per instance.
+_ARCHITECT_MODEL = os.getenv("ARCHITECT_MODEL", "gemini-1.5-pro")
+_DOMAIN_MODEL = os.getenv("DOMAIN_MODEL", "claude-3-5-sonnet-20241022")
+_QUALITY_MODEL = os.getenv("QUALITY_MODEL", "claude-3-5-sonnet-20241022")
+_CHAT_MODEL = os.getenv("CHAT_MODEL", "gemini-1.5-pro")
+_CHROMADB_PERSIST_DIR = os.getenv("CHROMADB_PERSIST_DIR", "./chromadb_store")
+_SKILLS_MANIFEST_DIR = os.getenv("SKILLS_MANIFEST_DIR", "./src/skills/manifests")
+_DATA_DIR = os.getenv("DATA_DIR", "./data")
+
+
 class PipelineConfig(BaseModel):
     """Configuration for the full discovery/chat pipeline."""
-    architect_model: str = Field(
-        default_factory=lambda: os.getenv("ARCHITECT_MODEL", "gemini-1.5-pro")
-    )
-    domain_model: str = Field(
-        default_factory=lambda: os.getenv("DOMAIN_MODEL", "claude-3-5-sonnet-20241022")
-    )
-    quality_model: str = Field(
-        default_factory=lambda: os.getenv("QUALITY_MODEL", "claude-3-5-sonnet-20241022")
-    )
-    chat_model: str = Field(
-        default_factory=lambda: os.getenv("CHAT_MODEL", "gemini-1.5-pro")
-    )
-    chromadb_persist_dir: str = Field(
-        default_factory=lambda: os.getenv("CHROMADB_PERSIST_DIR", "./chromadb_store")
-    )
-    skills_manifest_dir: str = Field(
-        default_factory=lambda: os.getenv("SKILLS_MANIFEST_DIR", "./src/skills/manifests")
-    )
-    data_dir: str = Field(
-        default_factory=lambda: os.getenv("DATA_DIR", "./data")
-    )
+    model_config = ConfigDict(frozen=True)
+
+    architect_model: str = _ARCHITECT_MODEL
+    domain_model: str = _DOMAIN_MODEL
+    quality_model: str = _QUALITY_MODEL
+    chat_model: str = _CHAT_MODEL
+    chromadb_persist_dir: str = _CHROMADB_PERSIST_DIR
+    skills_manifest_dir: str = _SKILLS_MANIFEST_DIR
+    data_dir: str = _DATA_DIR
 
 
 # ---------------------------------------------------------------------------
@@ -101,6 +103,10 @@ class PipelineConfig(BaseModel):
 
 class AgentResponse(BaseModel):
     """Standardised response from any agent in the pipeline."""
+    # Built many times per discovery run and never mutated; frozen skips
+    # assignment machinery and makes instances safely shareable.
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str
     role: AgentRole
     content: str
@@ -126,6 +132,8 @@ class ChatRequest(BaseModel):
 
 class ChatResponse(BaseModel):
     """Response from the skill-aware chat agent."""
+    model_config = ConfigDict(frozen=True)
+
     answer: str
     skill_hat: str
     sources: list[dict[str, Any]] = Field(default_factory=list)
@@ -136,8 +144,14 @@ class ChatResponse(BaseModel):
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def get_pipeline_config() -> PipelineConfig:
-    """Load pipeline configuration from environment."""
+    """Load pipeline configuration from environment.
+
+    Cached as a process-wide singleton: the environment doesn't change
+    at runtime, so re-reading every env var and rebuilding the Pydantic
+    model per request is pure overhead.
+    """
     return PipelineConfig()
 
 
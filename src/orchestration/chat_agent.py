@@ -9,17 +9,29 @@ Uses Google ADK's ``Agent`` class to create a chat agent that:
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from google.adk.agents import Agent
 
+from src.knowledge.vector_store import VectorStore
+from src.orchestration._genai_pool import get_model
 from src.orchestration.adk_core import (
     ChatRequest,
     ChatResponse,
     PipelineConfig,
     get_pipeline_config,
 )
-from src.orchestration.tools import retrieve_relevant_chunks, search_code, search_docs
+from src.orchestration.tools import (
+    retrieve_relevant_chunks,
+    retrieve_relevant_chunks_batch,
+    search_code,
+    search_docs,
+)
 from src.skills.registry import SkillRegistry
 
 
@@ -51,11 +63,53 @@ in the Skill Manifest below.
 
 ## Tool Usage:
 - Use `retrieve_relevant_chunks` for general queries about the codebase
+- Prefer `retrieve_relevant_chunks_batch` when you have multiple related queries — pass them all in one call
 - Use `search_code` when looking for specific code implementations
 - Use `search_docs` when looking for documentation or business rules
 
 Always cite your sources when referencing specific code or documentation."""
 
+# The template is multi-KB with two substitutions; split it once at
+# import so per-turn assembly is a join of five strings rather than a
+# full .format scan, and memoize the combined result per (hat, manifest).
+_TPL_PRE_HAT, _tpl_rest = SKILL_AWARE_INSTRUCTION_TEMPLATE.split("{skill_hat}", 1)
+_TPL_PRE_MANIFEST, _TPL_SUFFIX = _tpl_rest.split("{skills_md_content}", 1)
+
+
+@lru_cache(maxsize=32)
+def _build_instruction(skill_hat: str, skills_md_content: str) -> str:
+    """Assemble the system instruction for a skill hat and manifest."""
+    return "".join((
+        _TPL_PRE_HAT,
+        skill_hat.upper(),
+        _TPL_PRE_MANIFEST,
+        skills_md_content,
+        _TPL_SUFFIX,
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Manifest Cache
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=64)
+def _load_skill_cached(manifests_dir: str, skill_hat: str, mtime_ns: int) -> str:
+    """Read a skill manifest; the mtime key busts the cache on rewrite."""
+    return SkillRegistry(manifests_dir=manifests_dir).load_skill(skill_hat)
+
+
+def _load_skill(manifests_dir: str, skill_hat: str) -> str:
+    """Load a manifest, paying only a stat when it hasn't changed.
+
+    Manifests are multi-KB files consulted on every chat turn; keying an
+    lru_cache by (dir, skill, mtime) means repeat turns skip the read
+    while edits and re-discoveries are picked up immediately.
+    """
+    registry = SkillRegistry(manifests_dir=manifests_dir)
+    return _load_skill_cached(
+        manifests_dir, skill_hat, registry.skill_mtime_ns(skill_hat)
+    )
+
 
 # ---------------------------------------------------------------------------
 # Agent Factory
@@ -78,8 +132,7 @@ def create_skill_aware_agent(
     if config is None:
         config = get_pipeline_config()
 
-    registry = SkillRegistry(manifests_dir=config.skills_manifest_dir)
-    skills_md_content = registry.load_skill(skill_hat)
+    skills_md_content = _load_skill(config.skills_manifest_dir, skill_hat)
 
     if not skills_md_content:
         skills_md_content = (
@@ -88,17 +141,19 @@ def create_skill_aware_agent(
             "Run Discovery first to generate a skill manifest.*"
         )
 
-    instruction = SKILL_AWARE_INSTRUCTION_TEMPLATE.format(
-        skill_hat=skill_hat.upper(),
-        skills_md_content=skills_md_content,
-    )
+    instruction = _build_instruction(skill_hat, skills_md_content)
 
     return Agent(
         name=f"squadsense_{skill_hat.lower()}_agent",
         model=config.chat_model,
         instruction=instruction,
         description=f"Skill-Aware Developer Assistant for the {skill_hat} domain.",
-        tools=[retrieve_relevant_chunks, search_code, search_docs],
+        tools=[
+            retrieve_relevant_chunks,
+            retrieve_relevant_chunks_batch,
+            search_code,
+            search_docs,
+        ],
     )
 
 
@@ -130,33 +185,35 @@ async def answer(
         config = get_pipeline_config()
 
     try:
-        # --- Step 1: Retrieve relevant context ---
-        from src.knowledge.vector_store import VectorStore
-
+        # --- Step 1+2: Retrieve context and load the manifest together ---
+        # Both are blocking I/O (Chroma query, manifest stat/read) and
+        # independent, so the disk hit hides behind the vector search.
         store = VectorStore(persist_dir=config.chromadb_persist_dir)
-        relevant_chunks = store.query(
-            skill_name=request.skill_hat,
-            query_text=request.query,
-            n_results=5,
+        relevant_chunks, skills_content = await asyncio.gather(
+            asyncio.to_thread(
+                store.query, request.skill_hat, request.query, 5
+            ),
+            asyncio.to_thread(
+                _load_skill, config.skills_manifest_dir, request.skill_hat
+            ),
         )
 
-        context_text = "\n\n---\n\n".join(
-            f"**Source:** {chunk.metadata.get('file_path', chunk.metadata.get('source', 'unknown'))}\n\n{chunk.content}"
-            for chunk in relevant_chunks
-        )
-
-        # --- Step 2: Load skill manifest ---
-        registry = SkillRegistry(manifests_dir=config.skills_manifest_dir)
-        skills_content = registry.load_skill(request.skill_hat)
+        # One pass builds both the prompt context and the source refs —
+        # no second iteration, and the metadata dict is looked up once.
+        context_parts: list[str] = []
+        sources: list[dict[str, Any]] = []
+        for chunk in relevant_chunks:
+            md = chunk.metadata
+            src = md.get("file_path") or md.get("source") or "unknown"
+            context_parts.append(f"**Source:** {src}\n\n{chunk.content}")
+            sources.append({"id": chunk.id, "score": chunk.score, "metadata": md})
+        context_text = "\n\n---\n\n".join(context_parts)
 
         # --- Step 3: Build prompt and invoke model ---
-        import google.generativeai as genai
-
-        model = genai.GenerativeModel(config.chat_model)
+        model = get_model(config.chat_model)
 
-        system_instruction = SKILL_AWARE_INSTRUCTION_TEMPLATE.format(
-            skill_hat=request.skill_hat.upper(),
-            skills_md_content=skills_content or "*No manifest loaded*",
+        system_instruction = _build_instruction(
+            request.skill_hat, skills_content or "*No manifest loaded*"
         )
 
         # Build conversation with context
@@ -176,16 +233,8 @@ Please provide a detailed, skill-aware answer:"""
         response = await model.generate_content_async(full_prompt)
         answer_text = response.text or "I was unable to generate a response. Please try again."
 
-        sources = [
-            {
-                "id": chunk.id,
-                "score": chunk.score,
-                "metadata": chunk.metadata,
-            }
-            for chunk in relevant_chunks
-        ]
-
-        return ChatResponse(
+        # Trusted internal data — skip Pydantic validation
+        return ChatResponse.model_construct(
             answer=answer_text,
             skill_hat=request.skill_hat,
             sources=sources,
@@ -196,7 +245,7 @@ Please provide a detailed, skill-aware answer:"""
         )
 
     except Exception as e:
-        return ChatResponse(
+        return ChatResponse.model_construct(
             answer=f"❌ Error generating response: {str(e)}",
             skill_hat=request.skill_hat,
             sources=[],
@@ -204,15 +253,42 @@ Please provide a detailed, skill-aware answer:"""
         )
 
 
-def _format_history(history: list[dict[str, str]]) -> str:
+@dataclass(slots=True)
+class ConversationBuffer:
+    """Sliding window of pre-formatted conversation turns.
+
+    Long-lived callers (session-holding UIs) can append each turn once
+    as it happens instead of having ``_format_history`` re-format the
+    same trailing messages on every request; rendering is then a single
+    join over at most five strings.
+    """
+    _lines: deque[str] = field(default_factory=lambda: deque(maxlen=5))
+
+    def append(self, role: str, content: str) -> None:
+        """Record one finished turn, formatted once."""
+        self._lines.append(f"**{role.capitalize()}:** {content}")
+
+    def render(self) -> str:
+        """Render the buffered history for the prompt."""
+        if not self._lines:
+            return "*No prior conversation.*"
+        return "\n\n".join(self._lines)
+
+
+def _format_history(history: list[dict[str, str]] | ConversationBuffer) -> str:
     """Format conversation history for the prompt."""
+    if isinstance(history, ConversationBuffer):
+        return history.render()
     if not history:
         return "*No prior conversation.*"
 
+    # Walk the last 5 messages from the tail without slicing a copy of
+    # the (potentially long) history list.
     parts: list[str] = []
-    for msg in history[-5:]:  # Keep last 5 messages for context
+    for msg in islice(reversed(history), 5):
         role = msg.get("role", "user").capitalize()
         content = msg.get("content", "")
         parts.append(f"**{role}:** {content}")
+    parts.reverse()
 
     return "\n\n".join(parts)
@@ -13,11 +13,20 @@ The ``run_council`` function orchestrates the full pipeline.
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import hashlib
+import os
+import random
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple, Sequence
 
-from google.adk.agents import Agent
+import orjson
+
+from google.api_core import exceptions as gapi_exceptions
 from google.genai import types as genai_types
 
+from src.orchestration._genai_pool import get_model
 from src.orchestration.adk_core import (
     AgentResponse,
     AgentRole,
@@ -25,7 +34,6 @@ from src.orchestration.adk_core import (
     PipelineConfig,
     get_pipeline_config,
 )
-from src.orchestration.tools import retrieve_relevant_chunks
 from src.skills.registry import SkillRegistry
 
 
@@ -278,23 +286,37 @@ even if those patterns exist in the current codebase."""
 # Agent Factory
 # ---------------------------------------------------------------------------
 
+class _MiniAgent(NamedTuple):
+    """Lightweight agent spec for the direct-generation MVP path.
+
+    _run_single_agent only reads .name, .model and .instruction, so
+    building full ADK Agent objects (Pydantic init plus tool binding)
+    four times per discovery run bought nothing. Swap back to real
+    Agents when a proper Runner/Session enters the pipeline.
+    """
+    name: str
+    model: str
+    instruction: str
+    description: str
+
+
 def _create_council_agent(
     name: str,
     instruction: str,
     model: str,
     description: str,
-) -> Agent:
-    """Create a Google ADK Agent for the council."""
-    return Agent(
+) -> _MiniAgent:
+    """Create a council agent spec."""
+    return _MiniAgent(
         name=name,
         model=model,
         instruction=instruction,
         description=description,
-        tools=[retrieve_relevant_chunks],
     )
 
 
-def create_architect_agent(config: PipelineConfig) -> Agent:
+@lru_cache(maxsize=4)
+def create_architect_agent(config: PipelineConfig) -> _MiniAgent:
     """Create the Architect analysis agent."""
     return _create_council_agent(
         name="architect_agent",
@@ -304,7 +326,8 @@ def create_architect_agent(config: PipelineConfig) -> Agent:
     )
 
 
-def create_domain_expert_agent(config: PipelineConfig) -> Agent:
+@lru_cache(maxsize=4)
+def create_domain_expert_agent(config: PipelineConfig) -> _MiniAgent:
     """Create the Domain Expert analysis agent."""
     return _create_council_agent(
         name="domain_expert_agent",
@@ -314,7 +337,8 @@ def create_domain_expert_agent(config: PipelineConfig) -> Agent:
     )
 
 
-def create_quality_agent(config: PipelineConfig) -> Agent:
+@lru_cache(maxsize=4)
+def create_quality_agent(config: PipelineConfig) -> _MiniAgent:
     """Create the Quality analysis agent."""
     return _create_council_agent(
         name="quality_agent",
@@ -324,9 +348,10 @@ def create_quality_agent(config: PipelineConfig) -> Agent:
     )
 
 
-def create_synthesizer_agent(config: PipelineConfig) -> Agent:
+@lru_cache(maxsize=4)
+def create_synthesizer_agent(config: PipelineConfig) -> _MiniAgent:
     """Create the Synthesizer agent that merges all analyses."""
-    return Agent(
+    return _MiniAgent(
         name="synthesizer_agent",
         model=config.architect_model,  # Use Gemini for large context merge
         instruction=SYNTHESIZER_INSTRUCTION,
@@ -338,8 +363,83 @@ def create_synthesizer_agent(config: PipelineConfig) -> Agent:
 # Council Pipeline
 # ---------------------------------------------------------------------------
 
+# Concurrency cap shared by every Gemini call in this module: when
+# discovery is gathered over many skills, unbounded fan-out turns into
+# 429s that serialize through error handling anyway. Bounding up front
+# keeps throughput at the account rate limit instead.
+_GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+_gemini_semaphore = asyncio.Semaphore(_GEMINI_MAX_CONCURRENCY)
+
+_GENERATE_ATTEMPTS = 5
+
+
+async def _generate_with_retry(
+    model: Any,
+    prompt: str,
+    generation_config: genai_types.GenerateContentConfig,
+) -> str:
+    """Stream one generation under the shared cap, retrying rate limits.
+
+    Rate-limit and transient-unavailable errors back off exponentially
+    with jitter (the slot is released while sleeping); anything else
+    propagates to the caller's error handling.
+    """
+    for attempt in range(_GENERATE_ATTEMPTS):
+        try:
+            async with _gemini_semaphore:
+                response = await model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    stream=True,
+                )
+                parts: list[str] = []
+                async for chunk in response:
+                    if chunk.text:
+                        parts.append(chunk.text)
+                return "".join(parts)
+        except (
+            gapi_exceptions.ResourceExhausted,
+            gapi_exceptions.ServiceUnavailable,
+        ):
+            if attempt == _GENERATE_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(2 ** attempt + random.random())
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+async def _run_agent_cached(
+    cache_dir: Path,
+    agent: _MiniAgent,
+    role: AgentRole,
+    input_text: str,
+) -> AgentResponse:
+    """Run one agent through the content-addressed cache.
+
+    Keyed per agent (name, model, instruction, input), so a partial
+    rerun — say, after changing only the quality model — reuses the
+    unaffected analysts' responses instead of re-billing them.
+    """
+    key = _cache_key("agent", agent.name, agent.model, agent.instruction, input_text)
+    path = cache_dir / f"{key}.json"
+    cached = await asyncio.to_thread(_cache_load, path)
+    if cached is not None:
+        try:
+            response = AgentResponse.model_validate(cached)
+            if response.success:
+                return response
+        except Exception:
+            pass  # corrupt entry — fall through and regenerate
+
+    response = await _run_single_agent(agent, role, input_text)
+    if response.success and response.content:
+        await asyncio.to_thread(
+            _cache_store, path, response.model_dump(mode="json")
+        )
+    return response
+
+
 async def _run_single_agent(
-    agent: Agent,
+    agent: _MiniAgent,
     role: AgentRole,
     input_text: str,
 ) -> AgentResponse:
@@ -350,28 +450,33 @@ async def _run_single_agent(
     For the MVP, we invoke the agent via google.genai for direct generation.
     """
     try:
-        import google.generativeai as genai
-
-        model = genai.GenerativeModel(agent.model)
-        full_prompt = f"{agent.instruction}\n\n---\n\nCodebase chunks to analyze:\n\n{input_text}"
-
-        response = await model.generate_content_async(
+        # The stable instruction rides as system_instruction (cache-
+        # friendly constant prefix); only the variable text is user
+        # content.
+        model = get_model(agent.model, agent.instruction)
+        full_prompt = f"Codebase chunks to analyze:\n\n{input_text}"
+
+        # Streamed under the shared concurrency cap: tokens transfer
+        # while the model is still decoding, and rate limits back off
+        # instead of bubbling straight into a failed response.
+        content = await _generate_with_retry(
+            model,
             full_prompt,
-            generation_config=genai_types.GenerateContentConfig(
+            genai_types.GenerateContentConfig(
                 temperature=0.7,
                 max_output_tokens=4096,
             ),
         )
-        content = response.text or ""
 
-        return AgentResponse(
+        # Trusted internal data — skip Pydantic validation
+        return AgentResponse.model_construct(
             agent_name=agent.name,
             role=role,
             content=content,
             success=True,
         )
     except Exception as e:
-        return AgentResponse(
+        return AgentResponse.model_construct(
             agent_name=agent.name,
             role=role,
             content="",
@@ -380,10 +485,228 @@ async def _run_single_agent(
         )
 
 
-async def run_council(
+# --- Content-addressed result cache ---
+#
+# Re-running Discovery over unchanged chunks is common during iteration
+# and previously re-billed the full LLM cost. Results are cached on disk
+# keyed by a hash of everything that determines the output (skill name,
+# model ids, prompt text), so an identical rerun is a file read. Entries
+# are content-addressed; a change in chunks or models simply misses.
+
+_COUNCIL_CACHE_DIRNAME = ".council_cache"
+
+
+def _cache_key(*parts: str) -> str:
+    """Stable blake2b key over the inputs that determine an LLM output."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8", "replace"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _cache_load(path: Path) -> dict | None:
+    """Read a cached payload; any miss or corruption reads as None."""
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _cache_store(path: Path, payload: dict) -> None:
+    """Best-effort cache write — losing it only costs a future rerun."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(orjson.dumps(payload))
+    except OSError:
+        pass
+
+
+# --- Per-agent chunk routing ---
+#
+# Each analyst only needs the chunks that feed its brief: the Architect
+# reads structure, the Domain Expert reads docs and business logic, the
+# Quality agent reads code and its smells. Routing a bounded selection
+# per agent instead of pasting one giant concat into all three prompts
+# cuts duplicate input tokens and caps peak prompt size.
+
+#: Character budget for one agent's chunk selection (~50K tokens).
+_PER_AGENT_CHAR_BUDGET = 200_000
+
+_DECL_RE = re.compile(
+    r"(?m)^\s*(?:export\s+)?(?:public\s+|abstract\s+)?"
+    r"(?:class|interface|enum|def|function|module)\b"
+)
+_SMELL_RE = re.compile(r"TODO|FIXME|XXX|HACK|@deprecated|@Deprecated")
+_DOMAIN_RE = re.compile(
+    r"(?i)\b(?:formula|calculat\w*|validat\w*|rate|fee|reward|penalt\w*"
+    r"|invariant|constraint|business|rule)\b"
+)
+
+
+def _route_score(chunk: Any, role: AgentRole) -> int:
+    """Rank a chunk's relevance for one analyst role (higher = earlier).
+
+    Scores are cheap keyword/regex counts, not a tokenizer pass — the
+    budgets are character-based throughout this pipeline, so ranking
+    only needs to be relatively right, not token-exact.
+    """
+    is_code = getattr(chunk, "chunk_type", "code") == "code"
+    if role is AgentRole.ARCHITECT:
+        # Declarations and module structure over prose.
+        base = 2 if is_code else 0
+        return base + min(len(_DECL_RE.findall(chunk.content)), 8)
+    if role is AgentRole.DOMAIN_EXPERT:
+        # Docs carry the business rules; code with formula/validation
+        # vocabulary outranks plumbing code.
+        base = 2 if not is_code else 1
+        return base + min(len(_DOMAIN_RE.findall(chunk.content)), 8)
+    # Quality: code, with smell markers surfacing first.
+    base = 2 if is_code else 0
+    return base + min(len(_SMELL_RE.findall(chunk.content)), 8)
+
+
+def _select_chunk_text(
+    chunks: Sequence[Any],
+    budget: int,
+    role: AgentRole | None = None,
+) -> str:
+    """Join chunk contents up to ``budget`` chars, best-ranked first.
+
+    With ``role=None`` the original chunk order is kept (used for the
+    combined single-call prompt, which serves all three briefs at once).
+    """
+    if role is not None:
+        chunks = sorted(chunks, key=lambda c: _route_score(c, role), reverse=True)
+    selected: list[str] = []
+    used = 0
+    for chunk in chunks:
+        cost = len(chunk.content) + 9  # separator overhead
+        if used + cost > budget:
+            break
+        selected.append(chunk.content)
+        used += cost
+    return "\n\n---\n\n".join(selected)
+
+
+# Section markers for the combined single-call council prompt
+_SECTION_SPLIT_RE = re.compile(r"(?m)^#\s*(ARCHITECT|DOMAIN_EXPERT|QUALITY)\s*$")
+
+_COMBINED_SECTIONS = (
+    ("ARCHITECT", ARCHITECT_INSTRUCTION),
+    ("DOMAIN_EXPERT", DOMAIN_EXPERT_INSTRUCTION),
+    ("QUALITY", QUALITY_INSTRUCTION),
+)
+
+# Static system instruction for the combined single-call council; built
+# once so the constant prefix stays byte-identical across runs (a
+# prerequisite for provider-side prompt caching).
+_COMBINED_INSTRUCTION = (
+    "Produce ONE Markdown document containing exactly three top-level "
+    "sections, headed `# ARCHITECT`, `# DOMAIN_EXPERT` and `# QUALITY`, "
+    "in that order. Write each section by following its instructions "
+    "below, applied to the same codebase chunks.\n\n"
+    + "\n\n---\n\n".join(
+        f"## Instructions for the `# {name}` section:\n\n{instruction}"
+        for name, instruction in _COMBINED_SECTIONS
+    )
+)
+
+# Caps for the synthesis prompt: the synthesizer needs the findings, not
+# every code block the analysts quoted back out of the chunks.
+_MAX_SECTION_CHARS = 8000
+_MAX_FENCE_CHARS = 1200
+_FENCE_RE = re.compile(r"```.*?```", re.DOTALL)
+
+
+def _trim_analysis(content: str) -> str:
+    """Cap one agent analysis before it enters the synthesis prompt.
+
+    Oversized sections first have their long fenced code blocks replaced
+    with a marker (the analysts quote chunk bodies freely, and the
+    synthesizer never needs them verbatim), then get hard-truncated at a
+    line boundary. Every character here is paid for again as synthesizer
+    input tokens, typically the largest single call of the pipeline.
+    """
+    if len(content) > _MAX_SECTION_CHARS:
+        content = _FENCE_RE.sub(
+            lambda m: m.group(0) if len(m.group(0)) <= _MAX_FENCE_CHARS
+            else "```\n[... code block trimmed — see source chunks ...]\n```",
+            content,
+        )
+    if len(content) > _MAX_SECTION_CHARS:
+        content = (
+            content[:_MAX_SECTION_CHARS].rsplit("\n", 1)[0]
+            + "\n\n[... analysis truncated for synthesis ...]"
+        )
+    return content
+
+
+async def _run_combined_council(
+    config: PipelineConfig,
     code_chunks_text: str,
+) -> list[AgentResponse] | None:
+    """
+    Run all three analyses as one generation with labeled sections.
+
+    When the three analysis agents share a model, separate calls bill
+    the (large) code-chunk prompt three times and pay three network
+    round-trips for no quality gain. One call asking for three labeled
+    Markdown sections sends the chunks once; the output is split back
+    into per-role responses. Returns None if the call fails or any
+    section is missing, in which case the caller falls back to the
+    parallel per-agent path.
+    """
+    full_prompt = f"Codebase chunks to analyze:\n\n{code_chunks_text}"
+
+    try:
+        model = get_model(config.architect_model, _COMBINED_INSTRUCTION)
+        content = await _generate_with_retry(
+            model,
+            full_prompt,
+            genai_types.GenerateContentConfig(
+                temperature=0.7,
+                max_output_tokens=8192,  # three analyses in one generation
+            ),
+        )
+    except Exception:
+        return None
+
+    pieces = _SECTION_SPLIT_RE.split(content)
+    found = {
+        pieces[i]: pieces[i + 1].strip()
+        for i in range(1, len(pieces) - 1, 2)
+    }
+    if not all(name in found for name, _ in _COMBINED_SECTIONS):
+        return None
+
+    return [
+        AgentResponse.model_construct(
+            agent_name="architect_agent",
+            role=AgentRole.ARCHITECT,
+            content=found["ARCHITECT"],
+            success=True,
+        ),
+        AgentResponse.model_construct(
+            agent_name="domain_expert_agent",
+            role=AgentRole.DOMAIN_EXPERT,
+            content=found["DOMAIN_EXPERT"],
+            success=True,
+        ),
+        AgentResponse.model_construct(
+            agent_name="quality_agent",
+            role=AgentRole.QUALITY,
+            content=found["QUALITY"],
+            success=True,
+        ),
+    ]
+
+
+async def run_council(
+    code_chunks: str | Sequence[Any],
     skill_name: str,
     config: PipelineConfig | None = None,
+    per_agent_char_budget: int = _PER_AGENT_CHAR_BUDGET,
 ) -> DiscoveryResult:
     """
     Run the full LLM Council pipeline:
@@ -392,9 +715,12 @@ async def run_council(
       3. Save the resulting SKILLS.md
 
     Args:
-        code_chunks_text: Concatenated text of all code/doc chunks.
-        skill_name:       Name for the generated skill (e.g. "staking").
-        config:           Optional pipeline configuration.
+        code_chunks: The semantic chunks to analyze (SemanticChunk
+                     sequence, routed per agent under the budget) or a
+                     pre-concatenated string sent to all agents as-is.
+        skill_name:  Name for the generated skill (e.g. "staking").
+        config:      Optional pipeline configuration.
+        per_agent_char_budget: Cap on one agent's chunk text, in chars.
 
     Returns:
         DiscoveryResult with the generated SKILLS.md content.
@@ -402,54 +728,121 @@ async def run_council(
     if config is None:
         config = get_pipeline_config()
 
-    # --- Step 1: Create council agents ---
-    architect = create_architect_agent(config)
-    domain_expert = create_domain_expert_agent(config)
-    quality = create_quality_agent(config)
-    synthesizer = create_synthesizer_agent(config)
+    if isinstance(code_chunks, str):
+        shared_text = code_chunks
+        agent_texts = {role: code_chunks for role in (
+            AgentRole.ARCHITECT, AgentRole.DOMAIN_EXPERT, AgentRole.QUALITY
+        )}
+    else:
+        shared_text = _select_chunk_text(code_chunks, per_agent_char_budget)
+        agent_texts = {
+            role: _select_chunk_text(code_chunks, per_agent_char_budget, role)
+            for role in (
+                AgentRole.ARCHITECT, AgentRole.DOMAIN_EXPERT, AgentRole.QUALITY
+            )
+        }
+
+    # --- Step 0: Content-addressed lookup for the whole run ---
+    cache_dir = Path(config.data_dir) / _COUNCIL_CACHE_DIRNAME
+    run_key = _cache_key(
+        "discovery",
+        skill_name,
+        config.architect_model,
+        config.domain_model,
+        config.quality_model,
+        shared_text,
+        *agent_texts.values(),
+    )
+    run_path = cache_dir / f"{run_key}.json"
+    cached_run = await asyncio.to_thread(_cache_load, run_path)
+    if cached_run is not None:
+        try:
+            result = DiscoveryResult.model_validate(cached_run)
+        except Exception:
+            result = None
+        if result is not None:
+            # Re-save the manifest in case it was deleted since the run.
+            registry = SkillRegistry(manifests_dir=config.skills_manifest_dir)
+            await asyncio.to_thread(
+                registry.save_skill, skill_name, result.skills_md_content
+            )
+            return result
 
-    # --- Step 2: Run analysis agents in parallel ---
-    architect_task = _run_single_agent(architect, AgentRole.ARCHITECT, code_chunks_text)
-    domain_task = _run_single_agent(domain_expert, AgentRole.DOMAIN_EXPERT, code_chunks_text)
-    quality_task = _run_single_agent(quality, AgentRole.QUALITY, code_chunks_text)
+    synthesizer = create_synthesizer_agent(config)
 
-    responses = await asyncio.gather(architect_task, domain_task, quality_task)
+    # --- Step 1+2: Run the three analyses ---
+    # Homogeneous model config: one combined call sends the shared chunk
+    # selection once instead of three times. Heterogeneous (or combined-
+    # call failure): parallel per-agent calls on routed selections.
+    responses: list[AgentResponse] | None = None
+    if len({config.architect_model, config.domain_model, config.quality_model}) == 1:
+        responses = await _run_combined_council(config, shared_text)
+
+    if responses is None:
+        architect = create_architect_agent(config)
+        domain_expert = create_domain_expert_agent(config)
+        quality = create_quality_agent(config)
+        responses = list(await asyncio.gather(
+            _run_agent_cached(
+                cache_dir, architect, AgentRole.ARCHITECT,
+                agent_texts[AgentRole.ARCHITECT],
+            ),
+            _run_agent_cached(
+                cache_dir, domain_expert, AgentRole.DOMAIN_EXPERT,
+                agent_texts[AgentRole.DOMAIN_EXPERT],
+            ),
+            _run_agent_cached(
+                cache_dir, quality, AgentRole.QUALITY,
+                agent_texts[AgentRole.QUALITY],
+            ),
+        ))
 
     # --- Step 3: Synthesize into SKILLS.md ---
     synthesis_input = f"""# Analysis Results for {skill_name.upper()}
 
 ## Architect Agent Analysis:
-{responses[0].content}
+{_trim_analysis(responses[0].content)}
 
 ---
 
 ## Domain Expert Agent Analysis:
-{responses[1].content}
+{_trim_analysis(responses[1].content)}
 
 ---
 
 ## Quality Agent Analysis:
-{responses[2].content}
+{_trim_analysis(responses[2].content)}
 
 ---
 
 Please synthesize these three analyses into a single SKILLS.md manifest for the "{skill_name}" domain.
 """
 
-    synth_response = await _run_single_agent(
-        synthesizer, AgentRole.SYNTHESIZER, synthesis_input
+    # Cached like the analysts: the key covers the full synthesis input
+    # (skill name plus all three analyst outputs), so a rerun with
+    # bit-identical analyses skips the largest-context call entirely.
+    synth_response = await _run_agent_cached(
+        cache_dir, synthesizer, AgentRole.SYNTHESIZER, synthesis_input
     )
     all_responses = list(responses) + [synth_response]
 
     # --- Step 4: Save manifest ---
     skills_content = synth_response.content or f"# {skill_name.upper()} — Skill Manifest\n\n*Generation failed. Please retry.*"
 
+    # Manifest writes go through a worker thread: with several councils
+    # gathered concurrently, one skill's disk flush must not hold up the
+    # next skill's LLM dispatch on the event loop.
     registry = SkillRegistry(manifests_dir=config.skills_manifest_dir)
-    registry.save_skill(skill_name, skills_content)
+    await asyncio.to_thread(registry.save_skill, skill_name, skills_content)
 
-    return DiscoveryResult(
+    result = DiscoveryResult.model_construct(
         skill_name=skill_name,
         skills_md_content=skills_content,
         agent_responses=all_responses,
         chunks_ingested=0,  # Will be set by caller
     )
+    if synth_response.success and synth_response.content:
+        await asyncio.to_thread(
+            _cache_store, run_path, result.model_dump(mode="json")
+        )
+    return result
@@ -8,6 +8,8 @@ Google ADK auto-wraps them as FunctionTool when assigned to an Agent's
 
 from __future__ import annotations
 
+import threading
+
 from src.knowledge.vector_store import VectorStore
 
 
@@ -16,15 +18,30 @@ from src.knowledge.vector_store import VectorStore
 # ---------------------------------------------------------------------------
 
 _vector_store: VectorStore | None = None
+_vector_store_lock = threading.Lock()
 
 
 def _get_vector_store() -> VectorStore:
     global _vector_store
     if _vector_store is None:
-        _vector_store = VectorStore()
+        # ADK may dispatch tool calls from worker threads; without the
+        # lock, concurrent first calls race the None check and build
+        # duplicate Chroma clients and embedding models.
+        with _vector_store_lock:
+            if _vector_store is None:
+                _vector_store = VectorStore()
     return _vector_store
 
 
+def warmup() -> None:
+    """Build the shared store (Chroma client + embedding model) eagerly.
+
+    Called at server startup so the first tool call doesn't pay the
+    embedding-model load on the request path.
+    """
+    _get_vector_store()
+
+
 # ---------------------------------------------------------------------------
 # Retrieval Tools (plain functions —  ADK wraps these as FunctionTool)
 # ---------------------------------------------------------------------------
@@ -50,12 +67,11 @@ def retrieve_relevant_chunks(
         A list of dicts, each containing 'id', 'content', 'score', and 'metadata'.
     """
     store = _get_vector_store()
-    results = store.query(
+    return store.query_dicts(
         skill_name=skill_name,
         query_text=query,
         n_results=n_results,
     )
-    return [r.model_dump() for r in results]
 
 
 def search_code(
@@ -78,13 +94,12 @@ def search_code(
         A list of code chunk dicts with 'id', 'content', 'score', 'metadata'.
     """
     store = _get_vector_store()
-    results = store.query(
+    return store.query_dicts(
         skill_name=skill_name,
         query_text=query,
         n_results=n_results,
         metadata_filter={"type": "code"},
     )
-    return [r.model_dump() for r in results]
 
 
 def search_docs(
@@ -107,10 +122,39 @@ def search_docs(
         A list of documentation chunk dicts with 'id', 'content', 'score', 'metadata'.
     """
     store = _get_vector_store()
-    results = store.query(
+    return store.query_dicts(
         skill_name=skill_name,
         query_text=query,
         n_results=n_results,
         metadata_filter={"type": "doc"},
     )
-    return [r.model_dump() for r in results]
+
+
+def retrieve_relevant_chunks_batch(
+    queries: list[str],
+    skill_name: str,
+    n_results: int = 5,
+) -> list[list[dict]]:
+    """
+    Search the vector database for several related queries in one call.
+
+    Use this tool instead of calling ``retrieve_relevant_chunks``
+    repeatedly when you have multiple related sub-queries: all queries
+    are embedded together in a single batch and searched in one pass,
+    which is much faster than one call per query.
+
+    Args:
+        queries:    The search queries, one per sub-question.
+        skill_name: The skill domain to search within (e.g. "staking").
+        n_results:  Maximum number of results to return per query.
+
+    Returns:
+        One list of result dicts per query, in input order; each dict
+        contains 'id', 'content', 'score', and 'metadata'.
+    """
+    store = _get_vector_store()
+    return store.query_batch_dicts(
+        skill_name=skill_name,
+        query_texts=queries,
+        n_results=n_results,
+    )
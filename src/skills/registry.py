@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 import re
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +17,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Filename normalization for skill names; compiled once rather than per
+# _skill_path call (every registry operation goes through it).
+_SKILL_NAME_RE = re.compile(r"[^a-zA-Z0-9_]")
+
 
 class SkillRegistry:
     """
@@ -25,26 +30,51 @@ class SkillRegistry:
     manifests directory.
     """
 
+    #: How long a cached list_skills() result stays valid, in seconds.
+    LIST_CACHE_TTL = 5.0
+
     def __init__(self, manifests_dir: Optional[str] = None) -> None:
         self.manifests_dir = Path(
             manifests_dir or os.getenv("SKILLS_MANIFEST_DIR", "./src/skills/manifests")
         )
         self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        self._skills_cache: Optional[list[str]] = None
+        self._skills_cache_time = 0.0
+        self._path_cache: dict[str, Path] = {}
 
     def list_skills(self) -> list[str]:
         """
         List all available skill names by scanning the manifests directory.
 
+        The scan result is cached for a short TTL so frequently polled
+        endpoints (health checks, dashboards) don't re-walk the directory
+        on every call; saves and deletes invalidate the cache immediately.
+
         Returns:
             Sorted list of skill names (e.g. ["authentication", "staking"]).
         """
+        now = time.monotonic()
+        if (
+            self._skills_cache is not None
+            and now - self._skills_cache_time < self.LIST_CACHE_TTL
+        ):
+            return self._skills_cache
+
         skills: list[str] = []
         for file_path in self.manifests_dir.glob("*_SKILLS.md"):
             # Extract skill name from filename: STAKING_SKILLS.md -> staking
             name = file_path.stem.replace("_SKILLS", "").lower()
             if name:
                 skills.append(name)
-        return sorted(skills)
+
+        self._skills_cache = sorted(skills)
+        self._skills_cache_time = now
+        return self._skills_cache
+
+    def _invalidate_cache(self) -> None:
+        """Drop the cached skill list after a mutation."""
+        self._skills_cache = None
+        self._skills_cache_time = 0.0
 
     def load_skill(self, skill_name: str) -> str:
         """
@@ -74,6 +104,7 @@ class SkillRegistry:
         """
         file_path = self._skill_path(skill_name)
         file_path.write_text(content, encoding="utf-8")
+        self._invalidate_cache()
         return file_path
 
     def delete_skill(self, skill_name: str) -> bool:
@@ -86,6 +117,7 @@ class SkillRegistry:
         file_path = self._skill_path(skill_name)
         if file_path.exists():
             file_path.unlink()
+            self._invalidate_cache()
             return True
         return False
 
@@ -93,7 +125,27 @@ class SkillRegistry:
         """Check whether a manifest exists for the given skill."""
         return self._skill_path(skill_name).exists()
 
+    def skill_mtime_ns(self, skill_name: str) -> int:
+        """Modification time of a skill's manifest, or 0 if missing.
+
+        Cheap (one stat) — callers use it as a cache-invalidation key so
+        unchanged manifests don't need re-reading.
+        """
+        try:
+            return self._skill_path(skill_name).stat().st_mtime_ns
+        except OSError:
+            return 0
+
     def _skill_path(self, skill_name: str) -> Path:
-        """Build the file path for a skill manifest."""
-        normalized = re.sub(r"[^a-zA-Z0-9_]", "_", skill_name.strip()).upper()
-        return self.manifests_dir / f"{normalized}_SKILLS.md"
+        """Build the file path for a skill manifest.
+
+        Memoized per instance: exists/load/save/delete for the same
+        skill all repeat the normalization and Path join otherwise.
+        """
+        path = self._path_cache.get(skill_name)
+        if path is None:
+            normalized = _SKILL_NAME_RE.sub("_", skill_name.strip()).upper()
+            path = self._path_cache[skill_name] = (
+                self.manifests_dir / f"{normalized}_SKILLS.md"
+            )
+        return path
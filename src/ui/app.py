@@ -179,7 +179,7 @@ def run_discovery(data_path: str, skill_name: str) -> None:
     all_code_chunks = []
     for doc in code_docs:
         file_path = doc.metadata.get("local_path", doc.source)
-        chunks = parse_file(doc.content, file_path)
+        chunks = parse_file(doc.text(), file_path)
         all_code_chunks.extend(chunks)
 
     st.info(f"🔍 Extracted **{len(all_code_chunks)}** code units (methods, functions, classes).")
@@ -193,7 +193,7 @@ def run_discovery(data_path: str, skill_name: str) -> None:
     semantic_code = chunker.chunk_code(all_code_chunks)
     semantic_docs = []
     for doc in doc_docs:
-        semantic_docs.extend(chunker.chunk_document(doc.content, doc.source, doc.file_type))
+        semantic_docs.extend(chunker.chunk_document(doc.text(), doc.source, doc.file_type))
 
     all_semantic = semantic_code + semantic_docs
     st.info(
@@ -222,8 +222,7 @@ def run_discovery(data_path: str, skill_name: str) -> None:
     )
     progress.progress(80)
 
-    combined_text = "\n\n---\n\n".join(c.content for c in all_semantic[:50])
-    result = _run_async(run_council(combined_text, skill_name))
+    result = _run_async(run_council(all_semantic, skill_name))
     result.chunks_ingested = stored
 
     progress.progress(100)